@@ -0,0 +1,22 @@
+from pathlib import Path
+
+import pytest
+
+from create_mountaineer_app.generation import (
+    TEMPLATE_ENV,
+    LazyFileSystemBytecodeCache,
+    get_cache_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolate_template_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch):
+    # Keep compiled templates out of the developer's real cache directory, including
+    # for any subprocesses that resolve the cache path from the environment
+    cache_root: Path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_root))
+    monkeypatch.setattr(
+        TEMPLATE_ENV,
+        "bytecode_cache",
+        LazyFileSystemBytecodeCache(directory=str(get_cache_path() / "jinja")),
+    )
@@ -1,11 +1,21 @@
 from pathlib import Path
+from unittest.mock import patch
 
-from create_mountaineer_app.generation import ProjectMetadata, format_template
+import pytest
+from jinja2 import DictLoader, Environment, FileSystemLoader
+
+from create_mountaineer_app.generation import (
+    TEMPLATE_ENV,
+    LazyFileSystemBytecodeCache,
+    ProjectMetadata,
+    format_template,
+)
 from create_mountaineer_app.templates import get_template_path
 
 
-def test_path_url_replacement():
-    metadata = ProjectMetadata(
+@pytest.fixture
+def metadata():
+    return ProjectMetadata(
         project_name="TEST_PROJECT_NAME",
         author_name="TEST_AUTHOR",
         author_email="TEST_EMAIL",
@@ -17,8 +27,80 @@ def test_path_url_replacement():
         mountaineer_min_version="0.1.0",
         mountaineer_dev_path=None,
     )
+
+
+def test_path_url_replacement(metadata: ProjectMetadata):
     project_template_base = get_template_path("project")
     bundle = format_template(
         project_template_base / "[project_name]/app.py", project_template_base, metadata
     )
     assert bundle.path == "TEST_PROJECT_NAME/app.py"
+
+
+def test_template_compiled_once(metadata: ProjectMetadata):
+    project_template_base = get_template_path("project")
+    template_path = project_template_base / "[project_name]/app.py"
+
+    first = format_template(template_path, project_template_base, metadata)
+    second = format_template(template_path, project_template_base, metadata)
+    assert first == second
+
+    # The compiled template is kept in-process, regardless of the bytecode cache
+    template_name = "project/[project_name]/app.py"
+    assert TEMPLATE_ENV.get_template(template_name) is TEMPLATE_ENV.get_template(
+        template_name
+    )
+
+
+def test_missing_template(metadata: ProjectMetadata):
+    project_template_base = get_template_path("project")
+
+    with pytest.raises(FileNotFoundError):
+        format_template(
+            project_template_base / "missing.py", project_template_base, metadata
+        )
+
+
+def test_bytecode_cache_creates_directory(tmp_path: Path):
+    cache_dir = tmp_path / "nested" / "jinja"
+    env = Environment(
+        loader=DictLoader({"example.txt": "Hello {{ name }}"}),
+        bytecode_cache=LazyFileSystemBytecodeCache(directory=str(cache_dir)),
+    )
+
+    assert not cache_dir.exists()
+    assert env.get_template("example.txt").render(name="world") == "Hello world"
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+@pytest.mark.parametrize("use_tailwind", [True, False])
+def test_stream_to_output_root(
+    metadata: ProjectMetadata, use_tailwind: bool, tmp_path: Path
+):
+    project_template_base = get_template_path("project")
+    template_path = project_template_base / "[project_name]/views/postcss.config.js"
+    metadata.use_tailwind = use_tailwind
+
+    in_memory = format_template(template_path, project_template_base, metadata)
+    streamed = format_template(
+        template_path, project_template_base, metadata, output_root=tmp_path
+    )
+
+    output_path = tmp_path / "TEST_PROJECT_NAME/views/postcss.config.js"
+    assert streamed.path == in_memory.path
+    assert streamed.written == use_tailwind
+    assert output_path.exists() == use_tailwind
+    if use_tailwind:
+        assert output_path.read_text() == in_memory.content
+
+
+def test_path_multiple_replacements(metadata: ProjectMetadata, tmp_path: Path):
+    template_path = tmp_path / "[project_name]/[author_name]-[unknown].txt"
+    template_path.parent.mkdir(parents=True)
+    template_path.write_text("content")
+
+    with patch("create_mountaineer_app.generation.TEMPLATE_ROOT", tmp_path):
+        with patch.object(TEMPLATE_ENV, "loader", FileSystemLoader(str(tmp_path))):
+            bundle = format_template(template_path, tmp_path, metadata)
+
+    assert bundle.path == "TEST_PROJECT_NAME/TEST_AUTHOR-[unknown].txt"
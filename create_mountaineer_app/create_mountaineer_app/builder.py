@@ -68,22 +68,25 @@ def copy_source_to_project(template_base: Path, metadata: ProjectMetadata):
             continue
 
         try:
-            # Internally, format_template will re-look up the template
-            output_bundle = format_template(template_path, template_base, metadata)
+            # Internally, format_template will re-look up the template and stream
+            # the rendered output into the project
+            output_bundle = format_template(
+                template_path,
+                template_base,
+                metadata,
+                output_root=metadata.project_path,
+            )
         except Exception as e:
             secho(f"Error formatting {template_path}: {e}", fg="red")
             raise e
 
-        if not output_bundle.content.strip():
+        if not output_bundle.written:
             secho(
                 f"No content detected in {output_bundle.path}, skipping...", fg="yellow"
             )
             continue
 
-        secho(f"Creating {output_bundle.path}")
-        full_output = metadata.project_path / output_bundle.path
-        full_output.parent.mkdir(parents=True, exist_ok=True)
-        full_output.write_text(output_bundle.content)
+        secho(f"Created {output_bundle.path}")
 
 
 def build_project(metadata: ProjectMetadata, install_deps: bool = True):
@@ -1,9 +1,20 @@
 from enum import Enum
+from os import environ
 from pathlib import Path
-
-from jinja2 import Template
+from re import compile as re_compile
+from re import escape as re_escape
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateNotFound,
+)
+from jinja2.bccache import Bucket
 from pydantic import BaseModel
 
+from create_mountaineer_app.templates import get_template_path
+
 
 class EditorType(Enum):
     VSCODE = "vscode"
@@ -38,13 +49,63 @@ class ProjectMetadata(BaseModel):
     mountaineer_dev_path: Path | None = None
 
 
+# Matches bracketed metadata keys in template paths, like [project_name]
+FILENAME_VARIABLE_PATTERN = re_compile(
+    r"\[(" + "|".join(map(re_escape, ProjectMetadata.model_fields)) + r")\]"
+)
+
+
 class TemplateOutput(BaseModel):
     content: str
     path: str
 
+    # Set when the template was streamed straight to disk, in which case
+    # `content` is left empty
+    written: bool = False
+
+
+class LazyFileSystemBytecodeCache(FileSystemBytecodeCache):
+    """
+    Bytecode cache that only creates its directory on the first write. Caching is
+    best-effort: if the directory can't be written to (read-only home, sandboxed CI)
+    we fall back to compiling the templates in-process.
+
+    """
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            Path(self.directory).mkdir(parents=True, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def get_cache_path() -> Path:
+    cache_root = environ.get("XDG_CACHE_HOME")
+    base_path = Path(cache_root) if cache_root else Path.home() / ".cache"
+    return base_path / "create_mountaineer_app"
+
+
+# Shared across every format_template call so each template is only parsed and
+# compiled once per process. Rooted at the top-level templates directory since
+# we render both the project and the editor_configs trees. Compiled templates
+# are also persisted to disk so fresh CLI invocations skip the compile step.
+TEMPLATE_ROOT = get_template_path("")
+TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_ROOT)),
+    bytecode_cache=LazyFileSystemBytecodeCache(
+        directory=str(get_cache_path() / "jinja")
+    ),
+    auto_reload=False,
+    cache_size=-1,
+)
+
 
 def format_template(
-    path: Path, base_path: Path, project_metadata: ProjectMetadata
+    path: Path,
+    base_path: Path,
+    project_metadata: ProjectMetadata,
+    output_root: Path | None = None,
 ) -> TemplateOutput:
     """
     Takes in a template path (relative to /templates) and returns the formatted
@@ -54,17 +115,46 @@ def format_template(
         - Jinja templating within the file
         - Bracket syntax in filenames, like /path/to/[project_name]/file.txt
 
+    If `output_root` is provided, the rendered template is streamed directly to
+    `output_root / path` instead of being returned in memory. Templates that render
+    to only whitespace aren't written at all.
+
     """
-    if not path.exists():
+    try:
+        template = TEMPLATE_ENV.get_template(
+            path.resolve().relative_to(TEMPLATE_ROOT.resolve()).as_posix()
+        )
+    except (TemplateNotFound, ValueError):
         raise FileNotFoundError(f"Template file {path} does not exist")
 
     metadata_variables = project_metadata.model_dump()
 
-    template = Template(path.read_text())
-    content = template.render(metadata_variables)
-
     output_name = str(path.relative_to(base_path))
-    for key, value in metadata_variables.items():
-        output_name = output_name.replace(f"[{key}]", str(value))
-
-    return TemplateOutput(content=content, path=output_name)
+    if "[" in output_name:
+        output_name = FILENAME_VARIABLE_PATTERN.sub(
+            lambda match: str(metadata_variables[match.group(1)]), output_name
+        )
+
+    if output_root is None:
+        return TemplateOutput(
+            content=template.render(metadata_variables), path=output_name
+        )
+
+    # Hold back leading whitespace-only chunks so we don't create a file for
+    # templates that conditionally render to nothing
+    pending: list[str] = []
+    chunks = template.generate(metadata_variables)
+    for chunk in chunks:
+        pending.append(chunk)
+        if chunk.strip():
+            break
+    else:
+        return TemplateOutput(content="", path=output_name)
+
+    full_output = output_root / output_name
+    full_output.parent.mkdir(parents=True, exist_ok=True)
+    with full_output.open("w") as file:
+        file.writelines(pending)
+        file.writelines(chunks)
+
+    return TemplateOutput(content="", path=output_name, written=True)
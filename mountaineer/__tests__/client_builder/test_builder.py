@@ -2,15 +2,17 @@ from dataclasses import asdict, replace
 from json import dumps as json_dumps, loads as json_loads
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
 
 from mountaineer.actions import sideeffect
-from mountaineer.app import AppController
+from mountaineer.app import AppController, ControllerDefinition
 from mountaineer.client_builder.builder import ClientBuilder
 from mountaineer.controller import ControllerBase
 from mountaineer.controller_layout import LayoutControllerBase
+from mountaineer.paths import ManagedViewPath
 from mountaineer.render import RenderBase
 
 
@@ -111,6 +113,19 @@ def test_cache_is_outdated_no_existing_data(builder: ClientBuilder, tmp_path: Pa
     }
 
 
+def test_cache_is_outdated_looks_up_each_controller_once(
+    builder: ClientBuilder, tmp_path: Path
+):
+    builder.build_cache = tmp_path
+
+    with patch.object(
+        builder, "openapi_from_controller", wraps=builder.openapi_from_controller
+    ) as mock_openapi_from_controller:
+        builder.cache_is_outdated()
+
+    assert mock_openapi_from_controller.call_count == len(builder.app.controllers)
+
+
 def test_cache_is_outdated_existing_data(
     builder: ClientBuilder,
     tmp_path: Path,
@@ -267,7 +282,192 @@ def test_generate_controller_schema_sideeffect_required_attributes(
         "MySideeffectResponseSideEffect",
         "MySideeffectResponsePassthrough",
     }
+    assert list(schemas.keys()) == sorted(schemas.keys())
 
     assert "a: Array<DataBundle>" in schemas["SimpleRender"]
     assert "a: Array<DataBundle>" in schemas["MySideeffectResponseSideEffect"]
     assert "b: Array<DataBundle>" in schemas["MySideeffectResponsePassthrough"]
+
+
+def test_openapi_from_controller_cached(builder: ClientBuilder):
+    """
+    Multiple build stages request the same controller spec, which should
+    only be generated once per build.
+
+    """
+    with patch.object(
+        builder.app, "generate_openapi", wraps=builder.app.generate_openapi
+    ) as mock_generate_openapi:
+        builder.generate_model_definitions()
+        builder.generate_action_definitions()
+
+    assert mock_generate_openapi.call_count == len(builder.app.controllers)
+
+
+def test_openapi_definition_parsed_once(builder: ClientBuilder):
+    """
+    The model and action generators should share a single parsed definition
+    per controller rather than each re-validating the raw spec.
+
+    """
+    builder.generate_model_definitions()
+    builder.generate_action_definitions()
+
+    for controller_definition in builder.app.controllers:
+        definition = builder.openapi_definition_from_controller(controller_definition)
+        assert builder._openapi_definition_cache[controller_definition.controller] is (
+            definition
+        )
+
+    with patch.object(
+        builder, "openapi_from_controller", wraps=builder.openapi_from_controller
+    ) as mock_openapi_from_controller:
+        builder.generate_action_definitions()
+
+    assert mock_openapi_from_controller.call_count == 0
+
+
+def test_render_model_schemas_cached_across_builders(tmp_path: Path):
+    class ExampleRender(RenderBase):
+        value: int
+
+    class ExampleRenderController(ControllerBase):
+        url = "/"
+        view_path = "/page.tsx"
+
+        def render(self) -> ExampleRender:
+            return ExampleRender(value=1)
+
+    (tmp_path / "page.tsx").write_text("")
+    app_controller = AppController(view_root=tmp_path)
+    app_controller.register(ExampleRenderController())
+
+    first_builder = ClientBuilder(app_controller)
+    first_builder.generate_model_definitions()
+
+    second_builder = ClientBuilder(app_controller)
+    with patch.object(
+        second_builder.openapi_schema_converter,
+        "convert_schema_to_typescript",
+    ) as mock_convert:
+        second_builder.generate_model_definitions()
+
+    assert mock_convert.call_count == 0
+    assert "export interface ExampleRender" in (
+        (tmp_path / "_server" / "models.ts").read_text()
+    )
+
+
+def test_converters_shared_across_builders(simple_app_controller: AppController):
+    builder_a = ClientBuilder(simple_app_controller)
+    builder_b = ClientBuilder(simple_app_controller)
+
+    assert builder_a.openapi_schema_converter is builder_b.openapi_schema_converter
+    assert builder_a.openapi_action_converter is builder_b.openapi_action_converter
+    assert builder_a.openapi_schema_converter.export_interface
+
+
+def test_map_controllers_raises_worker_exceptions(builder: ClientBuilder):
+    def fail_on_detail(controller_definition: ControllerDefinition):
+        if isinstance(controller_definition.controller, ExampleDetailController):
+            raise ValueError("Detail failure")
+
+    with pytest.raises(ValueError, match="Detail failure"):
+        builder._map_controllers(fail_on_detail)
+
+
+def test_javascript_cache_is_outdated(builder: ClientBuilder, tmp_path: Path):
+    # No cache
+    assert builder.javascript_cache_is_outdated(builder.get_view_fingerprint())
+
+    builder.build_cache = tmp_path
+    for managed_dir in ["_static", "_ssr", "_metadata"]:
+        (builder.view_root / managed_dir).mkdir(exist_ok=True)
+
+    # No existing fingerprint
+    view_fingerprint = builder.get_view_fingerprint()
+    assert builder.javascript_cache_is_outdated(view_fingerprint)
+
+    (tmp_path / "client_builder_js.json").write_text(view_fingerprint)
+    assert not builder.javascript_cache_is_outdated(builder.get_view_fingerprint())
+
+    # Changes to a view file should invalidate the cache
+    (builder.view_root / "detail" / "page.tsx").write_text("export default 1;")
+    assert builder.javascript_cache_is_outdated(builder.get_view_fingerprint())
+
+
+def test_javascript_cache_is_outdated_plugin_outputs(
+    builder: ClientBuilder, tmp_path: Path
+):
+    builder.build_cache = tmp_path / "cache"
+    builder.build_cache.mkdir()
+
+    plugin_root = ManagedViewPath.from_view_root(tmp_path / "plugin")
+    for view_root in [builder.view_root, plugin_root]:
+        for managed_dir in ["_static", "_ssr", "_metadata"]:
+            (view_root / managed_dir).mkdir(parents=True, exist_ok=True)
+
+    with patch.object(
+        builder,
+        "get_all_root_views",
+        return_value=[builder.view_root, plugin_root],
+    ):
+        view_fingerprint = builder.get_view_fingerprint()
+        (builder.build_cache / "client_builder_js.json").write_text(view_fingerprint)
+        assert not builder.javascript_cache_is_outdated(view_fingerprint)
+
+        # Deleting a plugin's bundles should force a rebuild
+        (plugin_root / "_ssr").rmdir()
+        assert builder.javascript_cache_is_outdated(view_fingerprint)
+
+
+def test_view_fingerprint_skips_dangling_links(builder: ClientBuilder, tmp_path: Path):
+    view_fingerprint = builder.get_view_fingerprint()
+
+    # Mirrors the lock files that editors like Emacs create while a file is open
+    (builder.view_root / "detail" / ".#page.tsx").symlink_to(
+        tmp_path / "missing-lock-target"
+    )
+
+    assert builder.get_view_fingerprint() == view_fingerprint
+    assert builder.javascript_cache_is_outdated(builder.get_view_fingerprint())
+
+
+def test_view_fingerprint_ignores_build_outputs(builder: ClientBuilder):
+    view_fingerprint = builder.get_view_fingerprint()
+
+    static_dir = builder.view_root.get_managed_static_dir()
+    (static_dir / "home_controller-abc.js").write_text("console.log('built');")
+
+    assert builder.get_view_fingerprint() == view_fingerprint
+
+
+def test_controller_state_resolved_once(
+    builder: ClientBuilder, home_controller: ExampleHomeController
+):
+    with patch.object(
+        home_controller,
+        "_get_client_functions",
+        wraps=home_controller._get_client_functions,
+    ) as mock_get_client_functions:
+        builder.generate_view_servers()
+        builder.get_render_local_state(home_controller)
+        builder.get_controller_state(home_controller)
+
+    assert mock_get_client_functions.call_count == 1
+
+
+def test_validate_unique_paths_missing_view(
+    builder: ClientBuilder,
+):
+    class MissingViewController(ControllerBase):
+        url = "/missing/"
+        view_path = "/missing/page.tsx"
+
+        def render(self) -> None:
+            return None
+
+    builder.app.register(MissingViewController())
+
+    with pytest.raises(ValueError, match="does not exist"):
+        builder.validate_unique_paths()
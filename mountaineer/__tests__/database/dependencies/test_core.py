@@ -1,10 +1,20 @@
+import asyncio
+import gc
+import weakref
 from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from mountaineer.database.config import DatabaseConfig, PoolType
-from mountaineer.database.dependencies.core import get_db
+from mountaineer.database.dependencies.core import (
+    GLOBAL_ENGINE,
+    GLOBAL_SESSION_MAKER,
+    get_db,
+    get_db_session,
+    unregister_global_engine,
+)
 
 
 @pytest.mark.asyncio
@@ -29,3 +39,62 @@ async def test_get_db_null_pool(
 
     db_engine = await get_db(config=config)
     assert isinstance(db_engine.pool, pool_class)
+
+
+@pytest.mark.asyncio
+async def test_get_db_session_reuses_session_maker():
+    config = DatabaseConfig(
+        POSTGRES_HOST="localhost",
+        POSTGRES_USER="mock_user",
+        POSTGRES_PASSWORD="mock_password",
+        POSTGRES_DB="mock_db",
+    )
+    db_engine = await get_db(config=config)
+
+    async for session in get_db_session(engine=db_engine):
+        assert session.bind == db_engine
+    session_maker = GLOBAL_SESSION_MAKER.get_obj()
+    assert session_maker is not None
+
+    async for session in get_db_session(engine=db_engine):
+        assert session.bind == db_engine
+    assert GLOBAL_SESSION_MAKER.get_obj() is session_maker
+
+
+@pytest.mark.asyncio
+async def test_get_db_session_maker_released_with_engine():
+    config = DatabaseConfig(
+        POSTGRES_HOST="localhost",
+        POSTGRES_USER="mock_user",
+        POSTGRES_PASSWORD="mock_password",
+        POSTGRES_DB="mock_db",
+    )
+    db_engine = await get_db(config=config)
+    async for session in get_db_session(engine=db_engine):
+        pass
+    assert GLOBAL_SESSION_MAKER.get_obj() is not None
+
+    # Mirror the cleanup that runs once the event loop is garbage collected
+    loop_id = id(asyncio.get_running_loop())
+    GLOBAL_ENGINE.cleanup_loop(loop_id)
+    GLOBAL_SESSION_MAKER.cleanup_loop(loop_id)
+
+    engine_ref = weakref.ref(db_engine)
+    del db_engine, session
+    gc.collect()
+
+    assert GLOBAL_SESSION_MAKER.get_obj() is None
+    assert engine_ref() is None
+
+
+@pytest.mark.asyncio
+async def test_unregister_global_engine_disposes_all():
+    engines = [AsyncMock(), AsyncMock()]
+    for loop_id, engine in enumerate(engines):
+        GLOBAL_ENGINE.loop_caches[loop_id] = engine
+
+    await unregister_global_engine()
+
+    assert not GLOBAL_ENGINE.loop_caches
+    for engine in engines:
+        engine.dispose.assert_awaited_once()
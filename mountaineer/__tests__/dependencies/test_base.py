@@ -1,13 +1,30 @@
+import asyncio
+import warnings
+from contextlib import AsyncExitStack
+from functools import lru_cache
 from inspect import signature
+from unittest.mock import patch
 
 import pytest
-from fastapi import Depends, Request
-from typing_extensions import Callable
+from fastapi import BackgroundTasks, Depends, Request
+from fastapi.dependencies.utils import get_dependant
+from starlette.concurrency import run_in_threadpool
+from typing_extensions import Any, Callable
 
 from mountaineer.dependencies.base import (
+    BACKGROUND_TASKS_ERROR,
     DependenciesBase,
+    DependenciesBaseMeta,
+    DependencyPlan,
+    PlannedDependency,
+    compile_dependency_plan,
+    get_dependency_plan,
     get_function_dependencies,
+    get_plan_resolver,
+    get_request_defaults,
     isolate_dependency_only_function,
+    resolve_function_dependencies,
+    warm_dependencies,
 )
 
 
@@ -24,7 +41,10 @@ async def test_get_function_dependencies_recursive():
     def dep_3(dep_2: int = Depends(dep_2)):
         return dep_2 + 3
 
-    with pytest.warns(DeprecationWarning):
+    with (
+        patch.object(DependenciesBaseMeta, "deprecation_warned", False),
+        pytest.warns(DeprecationWarning),
+    ):
 
         class ExampleDependencies(DependenciesBase):
             dep_1: Callable
@@ -45,7 +65,11 @@ def test_incorrect_static_method():
     Ensure static methods will throw an error on init
 
     """
-    with pytest.warns(DeprecationWarning), pytest.raises(TypeError):
+    with (
+        patch.object(DependenciesBaseMeta, "deprecation_warned", False),
+        pytest.warns(DeprecationWarning),
+        pytest.raises(TypeError),
+    ):
 
         class ExampleIncorrectDependency(DependenciesBase):
             @staticmethod
@@ -76,6 +100,69 @@ async def test_dependency_overrides():
         assert result == "Final Value: Mocked Value"
 
 
+@pytest.mark.asyncio
+async def test_dependency_overrides_reused():
+    def dep_1():
+        return "Original Value"
+
+    def dep_2(
+        dep_1: str = Depends(dep_1),
+    ):
+        return dep_1
+
+    dependency_overrides = {dep_1: lambda: "First Mock"}
+
+    async with get_function_dependencies(
+        callable=dep_2, dependency_overrides=dependency_overrides
+    ) as values:
+        assert values == {"dep_1": "First Mock"}
+
+    # The overridden tree is planned once and resolved without FastAPI
+    with patch(
+        "mountaineer.dependencies.base.compile_dependency_plan",
+        side_effect=AssertionError("Plan compiled"),
+    ), patch(
+        "mountaineer.dependencies.base.solve_dependencies",
+        side_effect=AssertionError("FastAPI used"),
+    ):
+        async with get_function_dependencies(
+            callable=dep_2, dependency_overrides=dependency_overrides
+        ) as values:
+            assert values == {"dep_1": "First Mock"}
+
+    # Changes to the same dictionary should still be respected
+    dependency_overrides[dep_1] = lambda: "Second Mock"
+    async with get_function_dependencies(
+        callable=dep_2, dependency_overrides=dependency_overrides
+    ) as values:
+        assert values == {"dep_1": "Second Mock"}
+
+
+@pytest.mark.asyncio
+async def test_dependency_overrides_nested():
+    def dep_1():
+        return "Original Value"
+
+    def dep_2():
+        return "Original Nested Value"
+
+    def dep_root(dep_1: str = Depends(dep_1)):
+        pass
+
+    def mocked_dep_2():
+        return "Mocked Nested Value"
+
+    # Overrides should apply to the dependencies of other overrides
+    def mocked_dep_1(dep_2: str = Depends(dep_2)):
+        return dep_2
+
+    async with get_function_dependencies(
+        callable=dep_root,
+        dependency_overrides={dep_1: mocked_dep_1, dep_2: mocked_dep_2},
+    ) as values:
+        assert values == {"dep_1": "Mocked Nested Value"}
+
+
 class ExamplePayload:
     value: int
 
@@ -103,3 +190,552 @@ async def test_isolate_dependency_only_function():
         callable=modified_function,
     ) as values:
         assert values == {"resolved_dep": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_caches_dependant():
+    def dep_1():
+        return 1
+
+    def dep_2(dep_1: int = Depends(dep_1)):
+        return dep_1
+
+    with patch(
+        "mountaineer.dependencies.base.get_dependant", wraps=get_dependant
+    ) as mock_get_dependant:
+        for _ in range(2):
+            async with get_function_dependencies(callable=dep_2) as values:
+                assert values == {"dep_1": 1}
+
+    assert mock_get_dependant.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_resolves_in_order():
+    """
+    Dependencies are resolved one at a time, in the same order as FastAPI.
+
+    """
+    calls: list[str] = []
+
+    async def dep_leaf():
+        calls.append("leaf")
+        await asyncio.sleep(0)
+        calls.append("leaf_done")
+        return 1
+
+    async def dep_a(leaf: int = Depends(dep_leaf)):
+        calls.append("a")
+        await asyncio.sleep(0)
+        calls.append("a_done")
+        return "a"
+
+    def dep_b():
+        calls.append("b")
+        return "b"
+
+    def dep_root(
+        a: str = Depends(dep_a),
+        b: str = Depends(dep_b),
+        leaf: int = Depends(dep_leaf),
+    ):
+        pass
+
+    async with get_function_dependencies(callable=dep_root) as values:
+        assert values == {"a": "a", "b": "b", "leaf": 1}
+
+    assert calls == ["leaf", "leaf_done", "a", "a_done", "b"]
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_concurrent():
+    """
+    When opted in, independent dependencies should be resolved in parallel. Each
+    dependency here waits on the other one, so resolving them serially would time out.
+
+    """
+    event_a = asyncio.Event()
+    event_b = asyncio.Event()
+    shared_calls: list[int] = []
+
+    def dep_shared():
+        shared_calls.append(1)
+        return 1
+
+    async def dep_a(shared: int = Depends(dep_shared)):
+        event_a.set()
+        await event_b.wait()
+        return "a"
+
+    async def dep_b(shared: int = Depends(dep_shared)):
+        event_b.set()
+        await event_a.wait()
+        return "b"
+
+    def dep_root(
+        request: Request,
+        a: str = Depends(dep_a),
+        b: str = Depends(dep_b),
+        shared: int = Depends(dep_shared),
+    ):
+        pass
+
+    async def resolve_values():
+        async with get_function_dependencies(
+            callable=dep_root, concurrent=True
+        ) as values:
+            return values
+
+    values = await asyncio.wait_for(resolve_values(), timeout=1)
+    assert values["a"] == "a"
+    assert values["b"] == "b"
+    assert values["shared"] == 1
+    assert isinstance(values["request"], Request)
+
+    assert len(shared_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_concurrent_shared_generator():
+    """
+    Dependencies that share a generator (like a database session) are resolved
+    one at a time, even when concurrency is enabled.
+
+    """
+    active_users: list[str] = []
+    overlaps: list[str] = []
+
+    async def dep_session():
+        yield "session"
+
+    async def use_session(name: str):
+        if active_users:
+            overlaps.append(name)
+        active_users.append(name)
+        await asyncio.sleep(0)
+        active_users.remove(name)
+
+    async def dep_user(session: str = Depends(dep_session)):
+        await use_session("user")
+        return "user"
+
+    async def dep_org(session: str = Depends(dep_session)):
+        await use_session("org")
+        return "org"
+
+    def dep_root(user: str = Depends(dep_user), org: str = Depends(dep_org)):
+        pass
+
+    async with get_function_dependencies(callable=dep_root, concurrent=True) as values:
+        assert values == {"user": "user", "org": "org"}
+
+    assert not overlaps
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_concurrent_failure_cleanup():
+    """
+    If a dependency fails, siblings that are still being resolved should be cancelled
+    and cleaned up before the error reaches the caller.
+
+    """
+    events: list[str] = []
+
+    async def dep_generator():
+        events.append("open")
+        try:
+            await asyncio.sleep(0.05)
+            yield 1
+        finally:
+            events.append("cleanup")
+
+    async def dep_failure():
+        raise ValueError("Dependency failed")
+
+    def dep_root(
+        value: int = Depends(dep_generator),
+        failure: None = Depends(dep_failure),
+    ):
+        pass
+
+    with pytest.raises(ValueError, match="Dependency failed"):
+        async with get_function_dependencies(callable=dep_root, concurrent=True):
+            pass
+
+    assert events == ["open", "cleanup"]
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_generator_cleanup():
+    cleanup_calls: list[int] = []
+
+    async def dep_generator():
+        yield 1
+        cleanup_calls.append(1)
+
+    def dep_sync_generator(value: int = Depends(dep_generator)):
+        yield value + 1
+        cleanup_calls.append(2)
+
+    def dep_root(
+        value: int = Depends(dep_generator),
+        sync_value: int = Depends(dep_sync_generator),
+    ):
+        pass
+
+    async with get_function_dependencies(callable=dep_root) as values:
+        assert values == {"value": 1, "sync_value": 2}
+        assert not cleanup_calls
+
+    # Dependents are torn down before their dependencies
+    assert cleanup_calls == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_skips_exit_stack():
+    def dep_1():
+        return 1
+
+    def dep_root(value: int = Depends(dep_1)):
+        pass
+
+    with patch(
+        "mountaineer.dependencies.base.AsyncExitStack", wraps=AsyncExitStack
+    ) as mock_exit_stack:
+        async with get_function_dependencies(callable=dep_root) as values:
+            assert values == {"value": 1}
+
+    assert mock_exit_stack.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_synthetic_request():
+    def dep_request(request: Request):
+        return request
+
+    def dep_user(request: Request):
+        previous_user = getattr(request.state, "user", None)
+        request.state.user = "user"
+        return previous_user
+
+    def dep_root(
+        request_value: Any = Depends(dep_request),
+        previous_user: Any = Depends(dep_user),
+    ):
+        pass
+
+    async with get_function_dependencies(callable=dep_root) as values:
+        first_request = values["request_value"]
+        assert first_request.url.path == "/synthetic"
+        assert not first_request.query_params
+        assert not first_request.headers
+        assert values["previous_user"] is None
+
+    # State written by one call shouldn't leak into the next
+    async with get_function_dependencies(callable=dep_root) as values:
+        assert values["request_value"] is not first_request
+        assert values["previous_user"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_trivial():
+    def no_dependencies():
+        pass
+
+    with patch(
+        "mountaineer.dependencies.base.solve_dependency_plan"
+    ) as mock_solve_plan, patch(
+        "mountaineer.dependencies.base.solve_dependencies"
+    ) as mock_solve:
+        async with get_function_dependencies(callable=no_dependencies) as values:
+            assert values == {}
+
+    assert mock_solve_plan.call_count == 0
+    assert mock_solve.call_count == 0
+
+
+def test_deprecation_warned_once():
+    with (
+        patch.object(DependenciesBaseMeta, "deprecation_warned", False),
+        warnings.catch_warnings(record=True) as caught,
+    ):
+        warnings.simplefilter("always")
+
+        class ExampleFirstDependencies(DependenciesBase):
+            pass
+
+        class ExampleSecondDependencies(DependenciesBase):
+            pass
+
+    assert len(caught) == 1
+    assert issubclass(caught[0].category, DeprecationWarning)
+
+
+@pytest.mark.asyncio
+async def test_resolve_function_dependencies():
+    async def dep_1():
+        return 1
+
+    async def dep_generator():
+        yield 2
+
+    def dep_root(value: int = Depends(dep_1)):
+        pass
+
+    def dep_root_generator(value: int = Depends(dep_generator)):
+        pass
+
+    assert await resolve_function_dependencies(callable=dep_root) == {"value": 1}
+
+    with pytest.raises(ValueError, match="get_function_dependencies"):
+        await resolve_function_dependencies(callable=dep_root_generator)
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_memoizes_synthetic_errors():
+    dep_calls: list[int] = []
+
+    def dep_1():
+        dep_calls.append(1)
+        return 1
+
+    # The synthetic request never provides the required query param
+    def dep_root(required_value: int, value: int = Depends(dep_1)):
+        pass
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="Errors encountered"):
+            async with get_function_dependencies(callable=dep_root):
+                pass
+
+    assert dep_calls == [1]
+
+
+def test_dependency_structures_use_slots():
+    """
+    These are read on every resolution, so they shouldn't carry an instance dict.
+
+    """
+    for dependency_class in [
+        DependencyPlan,
+        PlannedDependency,
+    ]:
+        assert "__slots__" in dependency_class.__dict__
+        assert "__dict__" not in dependency_class.__dict__
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_single_layer_skips_gather():
+    async def dep_1():
+        return 1
+
+    async def dep_2(value: int = Depends(dep_1)):
+        return value + 1
+
+    def dep_root(value: int = Depends(dep_2)):
+        pass
+
+    with patch(
+        "mountaineer.dependencies.base.asyncio.gather", wraps=asyncio.gather
+    ) as mock_gather:
+        async with get_function_dependencies(callable=dep_root) as values:
+            assert values == {"value": 2}
+
+    assert mock_gather.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_dependency_plan_resolver():
+    def dep_sync():
+        return 1
+
+    async def dep_async(value: int = Depends(dep_sync)):
+        return value + 1
+
+    def dep_root(
+        sync_value: int = Depends(dep_sync),
+        async_value: int = Depends(dep_async),
+    ):
+        pass
+
+    plan = compile_dependency_plan(get_dependant(call=dep_root, path="/synthetic"))
+    assert plan.resolver is None
+
+    resolver = get_plan_resolver(plan, concurrent=False)
+    assert resolver is not None
+    assert resolver.__code__.co_filename == "<dependency resolver>"
+    assert plan.resolver is resolver
+
+    values = await resolver(get_request_defaults(None, None)[1], None)
+    assert values == {"sync_value": 1, "async_value": 2}
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_plans_use_fastapi():
+    def dep_1():
+        return "Original Value"
+
+    def dep_2(dep_1: str = Depends(dep_1)):
+        return dep_1
+
+    class UnhashableCallable:
+        __hash__ = None  # type: ignore
+
+        def __call__(self, dep_2: str = Depends(dep_2)):
+            pass
+
+    with patch(
+        "mountaineer.dependencies.base.compile_dependency_resolver",
+        side_effect=AssertionError("Resolver compiled for a one-off plan"),
+    ):
+        async with get_function_dependencies(callable=UnhashableCallable()) as values:
+            assert values == {"dep_2": "Original Value"}
+
+        # Fresh closures can never be found in the override cache again
+        async with get_function_dependencies(
+            callable=dep_2,
+            dependency_overrides={dep_1: lambda: "Mock Value"},
+        ) as values:
+            assert values == {"dep_1": "Mock Value"}
+
+
+@pytest.mark.asyncio
+async def test_dependency_overrides_exit_stack():
+    cleanup_calls: list[int] = []
+
+    def dep_1():
+        return "Original Value"
+
+    def dep_2(dep_1: str = Depends(dep_1)):
+        return dep_1
+
+    def mocked_dep_1():
+        return "Mocked Value"
+
+    async def mocked_generator_dep_1():
+        yield "Mocked Generator Value"
+        cleanup_calls.append(1)
+
+    # Plain overrides don't have anything to tear down
+    with patch.object(
+        AsyncExitStack, "__aenter__", side_effect=AssertionError("Stack entered")
+    ):
+        async with get_function_dependencies(
+            callable=dep_2, dependency_overrides={dep_1: mocked_dep_1}
+        ) as values:
+            assert values == {"dep_1": "Mocked Value"}
+
+    async with get_function_dependencies(
+        callable=dep_2, dependency_overrides={dep_1: mocked_generator_dep_1}
+    ) as values:
+        assert values == {"dep_1": "Mocked Generator Value"}
+        assert not cleanup_calls
+    assert cleanup_calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_memoized_dependencies_skip_threadpool():
+    @lru_cache
+    def dep_1():
+        return 1
+
+    def dep_2(value: int = Depends(dep_1)):
+        return value + 1
+
+    plan = compile_dependency_plan(get_dependant(call=dep_2, path="/synthetic"))
+    assert plan.layers is not None
+    assert plan.layers[0][0].is_memoized
+
+    with patch(
+        "mountaineer.dependencies.base.run_in_threadpool",
+        side_effect=AssertionError("Threadpool used"),
+    ):
+        async with get_function_dependencies(callable=dep_2) as values:
+            assert values == {"value": 1}
+
+    assert dep_1.cache_info().hits + dep_1.cache_info().misses == 1
+
+
+@pytest.mark.asyncio
+async def test_memoized_dependencies_with_arguments_use_threadpool():
+    def dep_1():
+        return 1
+
+    @lru_cache
+    def dep_2(value: int = Depends(dep_1)):
+        return value + 1
+
+    @lru_cache
+    def dep_request(request: Request):
+        return request.url.path
+
+    def dep_root(
+        value: int = Depends(dep_2),
+        path: str = Depends(dep_request),
+    ):
+        pass
+
+    plan = compile_dependency_plan(get_dependant(call=dep_root, path="/synthetic"))
+    assert plan.layers is not None
+    assert not any(
+        planned_dependency.is_memoized
+        for layer in plan.layers
+        for planned_dependency in layer
+    )
+
+    with patch(
+        "mountaineer.dependencies.base.run_in_threadpool",
+        wraps=run_in_threadpool,
+    ) as mock_threadpool:
+        assert await resolve_function_dependencies(callable=dep_root) == {
+            "value": 2,
+            "path": "/synthetic",
+        }
+
+    assert mock_threadpool.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_background_tasks_rejected():
+    def dep_1(background_tasks: BackgroundTasks):
+        background_tasks.add_task(print, "Side effect")
+        return 1
+
+    def dep_2(value: int = Depends(dep_1)):
+        pass
+
+    with pytest.raises(RuntimeError, match=BACKGROUND_TASKS_ERROR):
+        async with get_function_dependencies(callable=dep_2):
+            pass
+
+
+def test_warm_dependencies():
+    def dep_1():
+        return 1
+
+    def dep_2(value: int = Depends(dep_1)):
+        pass
+
+    warm_dependencies([dep_2], url="/example")
+
+    with patch(
+        "mountaineer.dependencies.base.compile_dependency_plan",
+        side_effect=AssertionError("Plan compiled"),
+    ):
+        plan = get_dependency_plan(dep_2, "/example")
+    assert plan.layers is not None
+
+
+def test_request_defaults():
+    url, request, is_synthetic = get_request_defaults(None, None)
+    assert url == "/synthetic"
+    assert request.url.path == "/synthetic"
+    assert is_synthetic
+
+    url, request, is_synthetic = get_request_defaults("/example", None)
+    assert url == "/example"
+    assert request.url.path == "/example"
+    assert is_synthetic
+
+    assert get_request_defaults(None, None)[1] is not request
+    assert get_request_defaults("/example", request) == ("/example", request, False)
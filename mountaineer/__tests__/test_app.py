@@ -98,6 +98,55 @@ def test_generate_openapi():
     }
 
 
+def test_generate_openapi_only_walks_included_controllers():
+    class ExampleException(APIException):
+        status_code = 401
+
+    class ExampleController(ControllerBase):
+        url = "/example"
+        view_path = "/example.tsx"
+
+        def render(self) -> None:
+            pass
+
+        @passthrough(exception_models=[ExampleException])
+        def test_exception_action(self) -> None:
+            pass
+
+    class ExampleControllerOther(ExampleController):
+        url = "/example_other"
+        view_path = "/example_other.tsx"
+
+    controller = ExampleController()
+    other_controller = ExampleControllerOther()
+
+    app = AppController(view_root=Path(""))
+    app.register(controller)
+    app.register(other_controller)
+
+    assert controller.definition
+    root_router = APIRouter()
+    root_router.include_router(
+        controller.definition.router, prefix=controller.definition.url_prefix
+    )
+
+    with patch.object(
+        other_controller,
+        "_get_client_functions",
+        wraps=other_controller._get_client_functions,
+    ) as mock_other_functions:
+        openapi_spec = app.generate_openapi(routes=root_router.routes)
+
+    assert mock_other_functions.call_count == 0
+    assert (
+        "401"
+        in OpenAPIDefinition(**openapi_spec)
+        .paths["/internal/api/example_controller/test_exception_action"]
+        .actions[0]
+        .responses
+    )
+
+
 def test_format_exception_model():
     class ExampleException(APIException):
         status_code = 401
@@ -321,6 +370,36 @@ def test_unique_controller_names():
         app.register(make_controller("/example2")())
 
 
+def test_warm_render_dependencies_on_startup():
+    class ExampleController(ControllerBase):
+        url = "/example"
+        view_path = "/example.tsx"
+
+        def render(self) -> None:
+            pass
+
+    class ExampleLayoutController(LayoutControllerBase):
+        view_path = "/layout.tsx"
+
+        def render(self) -> None:
+            pass
+
+    controller = ExampleController()
+    layout_controller = ExampleLayoutController()
+
+    app = AppController(view_root=Path(""))
+    app.register(controller)
+    app.register(layout_controller)
+
+    with patch("mountaineer.app.warm_dependencies") as mock_warm:
+        with TestClient(app.app):
+            pass
+
+    assert mock_warm.call_count == 2
+    mock_warm.assert_any_call([controller.render], url="/example")
+    mock_warm.assert_any_call([layout_controller.render])
+
+
 class TargetController(ControllerBase):
     url = "/target"
 
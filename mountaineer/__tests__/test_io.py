@@ -1,6 +1,8 @@
+from pathlib import Path
+
 import pytest
 
-from mountaineer.io import lru_cache_async
+from mountaineer.io import lru_cache_async, write_if_changed
 
 
 @pytest.mark.asyncio
@@ -41,3 +43,19 @@ async def test_lru_cache_async_limited_cache():
 
     # This new call will recompute the value for 1
     assert await cache_values(1) == 4
+
+
+def test_write_if_changed(tmp_path: Path):
+    path = tmp_path / "output.ts"
+
+    # New files are always written
+    assert write_if_changed(path, "export {};") is True
+    assert path.read_text() == "export {};"
+
+    # Identical content shouldn't touch the file
+    original_mtime = path.stat().st_mtime_ns
+    assert write_if_changed(path, "export {};") is False
+    assert path.stat().st_mtime_ns == original_mtime
+
+    assert write_if_changed(path, "export const a = 1;") is True
+    assert path.read_text() == "export const a = 1;"
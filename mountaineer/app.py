@@ -24,6 +24,7 @@ from mountaineer.config import ConfigBase
 from mountaineer.console import CONSOLE
 from mountaineer.controller import ControllerBase
 from mountaineer.controller_layout import LayoutControllerBase
+from mountaineer.dependencies import warm_dependencies
 from mountaineer.exceptions import APIException, APIExceptionInternalModelBase
 from mountaineer.js_compiler.base import ClientBuilderBase
 from mountaineer.js_compiler.javascript import JavascriptBundler
@@ -144,6 +145,7 @@ class AppController:
         self.app.exception_handler(APIException)(self.handle_exception)
 
         self.app.openapi = self.generate_openapi  # type: ignore
+        self.app.router.add_event_handler("startup", self.warm_render_dependencies)
 
     def register(self, controller: ControllerBase):
         """
@@ -359,6 +361,20 @@ class AppController:
         # Handle the resolution of the full signature of the render function
         self.greedy_merge_signatures(controller_definition)
 
+    def warm_render_dependencies(self):
+        """
+        Compile the dependency plans of every registered render function on startup,
+        so the first sideeffect that re-renders a page doesn't have to inspect them.
+
+        """
+        for controller_definition in self.controllers:
+            controller = controller_definition.controller
+            # Mirror the url that sideeffects resolve render() dependencies with
+            if isinstance(controller, LayoutControllerBase):
+                warm_dependencies([controller.render])
+            else:
+                warm_dependencies([controller.render], url=controller.url)
+
     async def handle_exception(self, request: Request, exc: APIException):
         return JSONResponse(
             status_code=exc.status_code,
@@ -517,6 +533,14 @@ class AppController:
         # Loop over the registered controllers and get the action exceptions
         exceptions_by_url: dict[str, list[ExceptionSchema]] = {}
         for controller_definition in self.controllers:
+            # Builds typically request the spec for one controller at a time, so avoid
+            # walking the members of controllers that can't have any paths in this spec
+            controller_prefix = f"{controller_definition.url_prefix}/"
+            if not any(
+                path.startswith(controller_prefix) for path in openapi_base["paths"]
+            ):
+                continue
+
             for (
                 _,
                 _,
@@ -117,10 +117,9 @@ class AsyncLoopObjectCache(Generic[T]):
         self.event_loop_refs = {}
 
     def get_obj(self) -> T | None:
-        loop = asyncio.get_running_loop()
-        if id(loop) not in self.loop_caches:
-            return None
-        return self.loop_caches[id(loop)]
+        # Hot path for every request that depends on a cached object, so we
+        # resolve with a single dictionary lookup
+        return self.loop_caches.get(id(asyncio.get_running_loop()))
 
     def set_obj(self, obj: T):
         loop = asyncio.get_running_loop()
@@ -146,9 +145,9 @@ class AsyncLoopObjectCache(Generic[T]):
         to be used again for that loop so we should cleanup associated objects.
 
         """
-        if loop_id in self.loop_caches:
-            del self.loop_caches[loop_id]
-        if loop_id in self.loop_locks:
-            del self.loop_locks[loop_id]
-        if loop_id in self.event_loop_refs:
-            del self.event_loop_refs[loop_id]
+        # Finalizers can fire from whichever thread triggers garbage collection, so
+        # we use atomic pops instead of check-then-delete to avoid racing with
+        # other threads that are tearing down the same loop.
+        self.loop_caches.pop(loop_id, None)
+        self.loop_locks.pop(loop_id, None)
+        self.event_loop_refs.pop(loop_id, None)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 from inflection import underscore
@@ -23,14 +24,22 @@ class OpenAPIToTypescriptActionConverter:
 
     """
 
-    def convert(self, openapi: dict[str, Any]) -> tuple[dict[str, str], list[str]]:
+    def convert(
+        self, openapi: dict[str, Any] | OpenAPIDefinition
+    ) -> tuple[dict[str, str], list[str]]:
         """
         Our conversion pipeline focuses on creating the action definitions of one file.
 
+        :param openapi: Raw OpenAPI spec, or an already parsed definition. Parsed definitions
+            are only read, so callers can share them with other generators.
         :return {function_name: function_body}, imports required by the function bodies
 
         """
-        schema = OpenAPIDefinition(**openapi)
+        schema = (
+            openapi
+            if isinstance(openapi, OpenAPIDefinition)
+            else OpenAPIDefinition(**openapi)
+        )
         output_actions: dict[str, str] = {}
         output_errors: dict[str, str] = {}
         all_required_types: set[str] = set()
@@ -282,3 +291,12 @@ class OpenAPIToTypescriptActionConverter:
 
         """
         return f"{exception_typehint}Exception"
+
+
+@lru_cache(maxsize=None)
+def get_action_converter() -> OpenAPIToTypescriptActionConverter:
+    """
+    Shared action converter, reused across builds in the same process.
+
+    """
+    return OpenAPIToTypescriptActionConverter()
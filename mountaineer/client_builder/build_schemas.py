@@ -1,6 +1,7 @@
 """
 Generator for TypeScript interfaces from OpenAPI specifications.
 """
+from functools import lru_cache
 from typing import Any, Dict, Iterator, Type, get_args, get_origin
 
 from inflection import camelize
@@ -226,3 +227,16 @@ class OpenAPIToTypescriptSchemaConverter:
                     raise ValueError(
                         f"Key must be a string for JSON dictionary serialization. Received `{typehint}`."
                     )
+
+
+@lru_cache(maxsize=None)
+def get_schema_converter(
+    export_interface: bool = False,
+) -> OpenAPIToTypescriptSchemaConverter:
+    """
+    Converters are stateless beyond their constructor arguments, so we share one
+    instance per configuration across builds. Call `get_schema_converter.cache_clear()`
+    to reset.
+
+    """
+    return OpenAPIToTypescriptSchemaConverter(export_interface=export_interface)
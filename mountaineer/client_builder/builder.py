@@ -1,12 +1,16 @@
 import asyncio
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from json import dumps as json_dumps
+from os import cpu_count
 from pathlib import Path
 from shutil import move as shutil_move, rmtree as shutil_rmtree
 from tempfile import TemporaryDirectory
+from threading import Lock
 from time import monotonic_ns
-from typing import Any
+from typing import Any, Callable, Type
+from weakref import WeakKeyDictionary
 
 from click import secho
 from fastapi import APIRouter
@@ -14,13 +18,11 @@ from inflection import camelize
 from pydantic_core import ValidationError
 
 from mountaineer.actions import get_function_metadata
-from mountaineer.actions.fields import FunctionActionType
+from mountaineer.actions.fields import FunctionActionType, FunctionMetadata
 from mountaineer.app import AppController, ControllerDefinition
-from mountaineer.client_builder.build_actions import (
-    OpenAPIToTypescriptActionConverter,
-)
+from mountaineer.client_builder.build_actions import get_action_converter
 from mountaineer.client_builder.build_links import OpenAPIToTypescriptLinkConverter
-from mountaineer.client_builder.build_schemas import OpenAPIToTypescriptSchemaConverter
+from mountaineer.client_builder.build_schemas import get_schema_converter
 from mountaineer.client_builder.openapi import (
     OpenAPIDefinition,
     OpenAPISchema,
@@ -34,11 +36,12 @@ from mountaineer.client_builder.typescript import (
 from mountaineer.console import CONSOLE
 from mountaineer.controller import ControllerBase
 from mountaineer.controller_layout import LayoutControllerBase
-from mountaineer.io import gather_with_concurrency
+from mountaineer.io import gather_with_concurrency, write_if_changed
 from mountaineer.js_compiler.base import ClientBundleMetadata
 from mountaineer.js_compiler.exceptions import BuildProcessException
 from mountaineer.logging import LOGGER
 from mountaineer.paths import ManagedViewPath, generate_relative_import
+from mountaineer.render import RenderBase
 from mountaineer.static import get_static_path
 
 
@@ -49,6 +52,31 @@ class RenderSpec:
     spec: dict[Any, Any] | None
 
 
+@dataclass
+class ControllerBuildState:
+    """
+    Values derived from a controller definition that are needed by multiple
+    generators. Resolving them requires walking the controller's members, so we
+    only do it once per build.
+
+    """
+
+    render_model: Type[RenderBase] | None
+    client_functions: list[FunctionMetadata]
+
+
+# Render models are shared between builds in the same process (like the JS-only
+# rebuilds triggered in dev mode), so their converted output is cached per model
+# class. Reloading user code creates new classes, which naturally invalidates these.
+RENDER_MODEL_SPECS: WeakKeyDictionary[
+    Type[RenderBase], dict[Any, Any]
+] = WeakKeyDictionary()
+RENDER_MODEL_SCHEMAS: WeakKeyDictionary[
+    Type[RenderBase], dict[str, str]
+] = WeakKeyDictionary()
+RENDER_MODEL_CACHE_LOCK = Lock()
+
+
 class ClientBuilder:
     """
     Main entrypoint for building the auto-generated typescript code.
@@ -61,10 +89,8 @@ class ClientBuilder:
         live_reload_port: int | None = None,
         build_cache: Path | None = None,
     ):
-        self.openapi_schema_converter = OpenAPIToTypescriptSchemaConverter(
-            export_interface=True
-        )
-        self.openapi_action_converter = OpenAPIToTypescriptActionConverter()
+        self.openapi_schema_converter = get_schema_converter(export_interface=True)
+        self.openapi_action_converter = get_action_converter()
         self.openapi_link_converter = OpenAPIToTypescriptLinkConverter()
 
         self.app = app
@@ -72,10 +98,20 @@ class ClientBuilder:
         self.live_reload_port = live_reload_port
         self.build_cache = build_cache
 
+        self._openapi_cache: dict[ControllerBase, dict[Any, Any]] = {}
+        self._openapi_definition_cache: dict[ControllerBase, OpenAPIDefinition] = {}
+        self._openapi_cache_lock = Lock()
+        self._controller_states: dict[ControllerBase, ControllerBuildState] = {}
+
     def build(self):
         asyncio.run(self.async_build())
 
     async def async_build(self):
+        # Controller routers might have changed since our last build
+        self._openapi_cache = {}
+        self._openapi_definition_cache = {}
+        self._controller_states = {}
+
         # Avoid rebuilding if we don't need to
         if self.cache_is_outdated():
             start = monotonic_ns()
@@ -118,7 +154,7 @@ class ClientBuilder:
         for static_filename in ["api.ts", "live_reload.ts"]:
             managed_code_dir = self.view_root.get_managed_code_dir()
             api_content = get_static_path(static_filename).read_text()
-            (managed_code_dir / static_filename).write_text(api_content)
+            write_if_changed(managed_code_dir / static_filename, api_content)
 
     def generate_model_definitions(self):
         """
@@ -127,56 +163,30 @@ class ClientBuilder:
         directly within the controller's view directory.
 
         """
-        for controller_definition in self.app.controllers:
-            controller = controller_definition.controller
-
-            schemas = self._generate_controller_schema(controller)
+        self._map_controllers(self._generate_model_definition)
 
-            # We put in one big models.ts file to enable potentially cyclical dependencies
-            managed_code_dir = self.view_root.get_controller_view_path(
-                controller
-            ).get_managed_code_dir()
-            (managed_code_dir / "models.ts").write_text(
-                "\n\n".join(
-                    [
-                        schema
-                        for _, schema in sorted(schemas.items(), key=lambda x: x[0])
-                    ]
-                )
-            )
+    def _generate_model_definition(self, controller_definition: ControllerDefinition):
+        controller = controller_definition.controller
 
-    def _generate_controller_schema(self, controller: ControllerBase):
-        action_spec_openapi = self.openapi_action_specs[controller]
+        schemas = self._generate_controller_schema(controller)
 
-        try:
-            action_base = OpenAPIDefinition(**action_spec_openapi)
-        except ValidationError as e:
-            LOGGER.error(
-                f"Error parsing {controller} action spec: {action_spec_openapi} {e}"
-            )
-            raise e
+        # We put in one big models.ts file to enable potentially cyclical dependencies
+        managed_code_dir = self.view_root.get_controller_view_path(
+            controller
+        ).get_managed_code_dir()
+        write_if_changed(managed_code_dir / "models.ts", "\n\n".join(schemas.values()))
 
-        render_spec_openapi = self.openapi_render_specs[controller]
-        render_base = (
-            OpenAPISchema(**render_spec_openapi.spec)
-            if render_spec_openapi.spec
-            else None
+    def _generate_controller_schema(self, controller: ControllerBase):
+        action_base = self.openapi_definition_from_controller(
+            self.app.definition_for_controller(controller)
         )
 
         schemas: dict[str, str] = {}
 
         # Convert the render model
-        if render_base:
-            for (
-                schema_name,
-                component,
-            ) in self.openapi_schema_converter.convert_schema_to_typescript(
-                render_base,
-                # Render models are sent server -> client, so we know they'll provide all their
-                # values in the initial payload
-                all_fields_required=True,
-            ).items():
-                schemas[schema_name] = component
+        render_model = self.get_controller_state(controller).render_model
+        if render_model:
+            schemas.update(self.get_render_model_schemas(render_model))
 
         # Convert all the other models defined in sideeffect routes
         # Iterate through all paths and their actions
@@ -228,7 +238,8 @@ class ClientBuilder:
                 all_fields_required=all_fields_required,
             )
 
-        return schemas
+        # Order by schema name so the generated file is deterministic across builds
+        return {schema_name: schemas[schema_name] for schema_name in sorted(schemas)}
 
     def generate_action_definitions(self):
         """
@@ -236,34 +247,38 @@ class ClientBuilder:
         via the OpenAPI schema and the internal router.
 
         """
-        for controller_definition in self.app.controllers:
-            controller = controller_definition.controller
-            controller_code_dir = self.view_root.get_controller_view_path(
-                controller
-            ).get_managed_code_dir()
-            root_code_dir = self.view_root.get_managed_code_dir()
-
-            controller_action_path = controller_code_dir / "actions.ts"
-            root_common_handler = root_code_dir / "api.ts"
-            root_api_import_path = generate_relative_import(
-                controller_action_path, root_common_handler
-            )
+        self._map_controllers(self._generate_action_definition)
+
+    def _generate_action_definition(self, controller_definition: ControllerDefinition):
+        controller = controller_definition.controller
+        controller_code_dir = self.view_root.get_controller_view_path(
+            controller
+        ).get_managed_code_dir()
+        root_code_dir = self.view_root.get_managed_code_dir()
+
+        controller_action_path = controller_code_dir / "actions.ts"
+        root_common_handler = root_code_dir / "api.ts"
+        root_api_import_path = generate_relative_import(
+            controller_action_path, root_common_handler
+        )
 
-            openapi_raw = self.openapi_from_controller(controller_definition)
-            output_schemas, required_types = self.openapi_action_converter.convert(
-                openapi_raw
-            )
+        openapi_definition = self.openapi_definition_from_controller(
+            controller_definition
+        )
+        output_schemas, required_types = self.openapi_action_converter.convert(
+            openapi_definition
+        )
 
-            chunks: list[str] = []
+        chunks: list[str] = []
 
-            chunks.append(
-                f"import {{ __request, FetchErrorBase }} from '{root_api_import_path}';\n"
-                + f"import type {{ {', '.join(required_types)} }} from './models';"
-            )
+        chunks.append(
+            f"import {{ __request, FetchErrorBase }} from '{root_api_import_path}';\n"
+            + f"import type {{ {', '.join(required_types)} }} from './models';"
+        )
 
-            chunks += output_schemas.values()
+        chunks += output_schemas.values()
 
-            controller_action_path.write_text("\n\n".join(chunks))
+        write_if_changed(controller_action_path, "\n\n".join(chunks))
 
     def generate_link_shortcuts(self):
         """
@@ -290,7 +305,7 @@ class ClientBuilder:
             # This file still needs to exist for downstream exports so we write
             # a blank file
             if render_route is None:
-                controller_links_path.write_text("")
+                write_if_changed(controller_links_path, "")
                 continue
 
             render_openapi = self.app.generate_openapi(
@@ -301,7 +316,7 @@ class ClientBuilder:
             content += f"import {{ __getLink }} from '{root_api_import_path}';\n"
             content += self.openapi_link_converter.convert(render_openapi)
 
-            controller_links_path.write_text(content)
+            write_if_changed(controller_links_path, content)
 
     def generate_link_aggregator(self):
         """
@@ -344,7 +359,7 @@ class ClientBuilder:
             "export default linkGenerator;",
         ]
 
-        (global_code_dir / "links.ts").write_text("\n".join(lines))
+        write_if_changed(global_code_dir / "links.ts", "\n".join(lines))
 
     def generate_view_servers(self):
         """
@@ -353,105 +368,114 @@ class ClientBuilder:
         is linked to that controller.
 
         """
-        for controller_definition in self.app.controllers:
-            controller = controller_definition.controller
-            controller_key = controller.__class__.__name__
-
-            chunks: list[str] = []
-
-            # Step 1: Interface to optionally override the current controller state
-            # We want to have an inline reference to a model which is compatible with the base render model alongside
-            # all sideeffect sub-models. Since we're re-declaring this in the server file, we also
-            # have to bring with us all of the other sub-model imports.
-            render_model_name = self.get_render_local_state(controller)
+        self._map_controllers(self._generate_view_server)
+
+    def _generate_view_server(self, controller_definition: ControllerDefinition):
+        controller = controller_definition.controller
+        controller_key = controller.__class__.__name__
+
+        chunks: list[str] = []
+
+        # Step 1: Interface to optionally override the current controller state
+        # We want to have an inline reference to a model which is compatible with the base render model alongside
+        # all sideeffect sub-models. Since we're re-declaring this in the server file, we also
+        # have to bring with us all of the other sub-model imports.
+        render_model_name = self.get_render_local_state(controller)
+
+        # Step 2: Find the actions that are relevant
+        controller_action_metadata = self.get_controller_state(
+            controller
+        ).client_functions
+
+        # Step 2: Setup imports from the single global provider
+        controller_model_path = self.view_root.get_controller_view_path(
+            controller
+        ).get_managed_code_dir()
+        global_server_path = self.view_root.get_managed_code_dir()
+        relative_server_path = generate_relative_import(
+            controller_model_path, global_server_path
+        )
 
-            # Step 2: Find the actions that are relevant
-            controller_action_metadata = [
-                metadata for _, _, metadata in controller._get_client_functions()
-            ]
+        action_names = [
+            metadata.function_name for metadata in controller_action_metadata
+        ]
 
-            # Step 2: Setup imports from the single global provider
-            controller_model_path = self.view_root.get_controller_view_path(
-                controller
-            ).get_managed_code_dir()
-            global_server_path = self.view_root.get_managed_code_dir()
-            relative_server_path = generate_relative_import(
-                controller_model_path, global_server_path
+        chunks.append(
+            "".join(
+                [
+                    "import React, { useState } from 'react';\n",
+                    f"import {{ applySideEffect }} from '{relative_server_path}/api';\n",
+                    f"import LinkGenerator from '{relative_server_path}/links';\n",
+                    f"import {{ {render_model_name} }} from './models';\n",
+                    (
+                        f"import {{ {', '.join(action_names)} }} from './actions';"
+                        if action_names
+                        else ""
+                    ),
+                ]
             )
+        )
 
-            chunks.append(
-                "import React, { useState } from 'react';\n"
-                + f"import {{ applySideEffect }} from '{relative_server_path}/api';\n"
-                + f"import LinkGenerator from '{relative_server_path}/links';\n"
-                + f"import {{ {render_model_name} }} from './models';\n"
-                + (
-                    f"import {{ {', '.join([metadata.function_name for metadata in controller_action_metadata])} }} from './actions';"
-                    if controller_action_metadata
-                    else ""
-                )
-            )
+        # Step 3: Add the optional model definition - this allows any controller that returns a partial
+        # side-effect to update the full model with the same typehint
+        optional_model_name = f"{render_model_name}Optional"
+        chunks.append(
+            f"export type {optional_model_name} = Partial<{render_model_name}>;"
+        )
 
-            # Step 3: Add the optional model definition - this allows any controller that returns a partial
-            # side-effect to update the full model with the same typehint
-            optional_model_name = f"{render_model_name}Optional"
-            chunks.append(
-                f"export type {optional_model_name} = Partial<{render_model_name}>;"
+        # Step 4: We expect another script has already injected this global `SERVER_DATA` constant. We
+        # add the typehinting here just so that the IDE can be happy.
+        chunks.append("declare global {\n" "var SERVER_DATA: any;\n" "}\n")
+
+        # Step 5: Typehint the return type of the server state in case client callers
+        # want to pass this to sub-functions
+        chunks.append(
+            "".join(
+                [
+                    f"export interface ServerState extends {render_model_name} {{\n",
+                    "linkGenerator: typeof LinkGenerator;\n",
+                    "\n".join([f"{name}: typeof {name};" for name in action_names]),
+                    "}\n",
+                ]
             )
+        )
 
-            # Step 4: We expect another script has already injected this global `SERVER_DATA` constant. We
-            # add the typehinting here just so that the IDE can be happy.
-            chunks.append("declare global {\n" "var SERVER_DATA: any;\n" "}\n")
-
-            # Step 5: Typehint the return type of the server state in case client callers
-            # want to pass this to sub-functions
-            chunks.append(
-                f"export interface ServerState extends {render_model_name} {{\n"
-                + "linkGenerator: typeof LinkGenerator;\n"
-                + (
-                    "\n".join(
+        # Step 6: Final implementation of the useServer() hook, which returns a subview of the overall
+        # server state that's only relevant to this controller
+        chunks.append(
+            "".join(
+                [
+                    "export const useServer = () : ServerState => {\n",
+                    f"const [ serverState, setServerState ] = useState(SERVER_DATA['{controller_key}'] as {render_model_name});\n",
+                    # Local function to just override the current controller
+                    # We make sure to wait for the previous state to be set, in case of a
+                    # differential update
+                    f"const setControllerState = (payload: {optional_model_name}) => {{\n",
+                    "setServerState((state) => ({\n",
+                    "...state,\n",
+                    "...payload,\n",
+                    "}));\n",
+                    "};\n",
+                    "return {\n",
+                    "...serverState,\n",
+                    "linkGenerator: LinkGenerator,\n",
+                    ",\n".join(
                         [
-                            f"{metadata.function_name}: typeof {metadata.function_name};"
+                            (
+                                f"{metadata.function_name}: applySideEffect({metadata.function_name}, setControllerState)"
+                                if metadata.action_type == FunctionActionType.SIDEEFFECT
+                                else f"{metadata.function_name}: {metadata.function_name}"
+                            )
                             for metadata in controller_action_metadata
                         ]
-                    )
-                    if controller_action_metadata
-                    else ""
-                )
-                + "}\n"
-            )
-
-            # Step 6: Final implementation of the useServer() hook, which returns a subview of the overall
-            # server state that's only relevant to this controller
-            chunks.append(
-                "export const useServer = () : ServerState => {\n"
-                + f"const [ serverState, setServerState ] = useState(SERVER_DATA['{controller_key}'] as {render_model_name});\n"
-                # Local function to just override the current controller
-                # We make sure to wait for the previous state to be set, in case of a
-                # differential update
-                + f"const setControllerState = (payload: {optional_model_name}) => {{\n"
-                + "setServerState((state) => ({\n"
-                + "...state,\n"
-                + "...payload,\n"
-                + "}));\n"
-                + "};\n"
-                + "return {\n"
-                + "...serverState,\n"
-                + "linkGenerator: LinkGenerator,\n"
-                + ",\n".join(
-                    [
-                        (
-                            f"{metadata.function_name}: applySideEffect({metadata.function_name}, setControllerState)"
-                            if metadata.action_type == FunctionActionType.SIDEEFFECT
-                            else f"{metadata.function_name}: {metadata.function_name}"
-                        )
-                        for metadata in controller_action_metadata
-                    ]
-                )
-                + "}\n"
-                + "};"
+                    ),
+                    "}\n",
+                    "};",
+                ]
             )
+        )
 
-            (controller_model_path / "useServer.ts").write_text("\n\n".join(chunks))
+        write_if_changed(controller_model_path / "useServer.ts", "\n\n".join(chunks))
 
     def generate_index_file(self):
         for controller_definition in self.app.controllers:
@@ -467,16 +491,23 @@ class ClientBuilder:
             chunks.append("export * from './models';")
             chunks.append("export * from './useServer';")
 
-            (controller_code_dir / "index.ts").write_text("\n".join(chunks))
+            write_if_changed(controller_code_dir / "index.ts", "\n".join(chunks))
 
     async def build_javascript_chunks(self, max_concurrency: int = 25):
         """
         Build the final javascript chunks that will render the react documents. Each page will get
-        one chunk associated with it. We suffix these files with the current md5 hash of the contents to
+        one chunk associated with it. We suffix these files with the current content hash of the contents to
         allow clients to aggressively cache these contents but invalidate the cache whenever the script
         contents have rebuilt in the background.
 
         """
+        # Skip the bundling entirely if none of the view files have changed since
+        # the last successful build
+        view_fingerprint = self.get_view_fingerprint()
+        if not self.javascript_cache_is_outdated(view_fingerprint):
+            CONSOLE.print("[bold green]Frontend bundles up to date")
+            return
+
         metadata = ClientBundleMetadata(
             live_reload_port=self.live_reload_port,
         )
@@ -542,13 +573,18 @@ class ClientBuilder:
 
         self.move_build_artifacts_into_project()
 
+        # Only record the fingerprint once the build artifacts are in place, so a
+        # failed build will be retried next time
+        if self.build_cache:
+            (self.build_cache / "client_builder_js.json").write_text(view_fingerprint)
+
     def move_build_artifacts_into_project(self):
         """
         Now that we build has completed, we can clear out the old files and replace it
         with the thus-far temporary files
 
         This cleans up old controllers in the case that they were deleted, and prevents
-        outdated md5 content hashes from being served
+        outdated content hashes from being served
 
         """
         with TemporaryDirectory() as tmp_dir:
@@ -608,7 +644,7 @@ class ClientBuilder:
 
         cached_contents = {
             controller_definition.controller.__class__.__name__: {
-                "action": self.openapi_action_specs[controller_definition.controller],
+                "action": self.openapi_from_controller(controller_definition),
                 "render": asdict(
                     self.openapi_render_specs[controller_definition.controller]
                 ),
@@ -627,6 +663,81 @@ class ClientBuilder:
 
         return False
 
+    def javascript_cache_is_outdated(self, view_fingerprint: str):
+        """
+        Determines if the bundled javascript from our last build is outdated. Unlike
+        cache_is_outdated, this doesn't update the cache - we only want to persist
+        the fingerprint after the build has succeeded.
+
+        """
+        if not self.build_cache:
+            return True
+
+        cached_metadata = self.build_cache / "client_builder_js.json"
+        if not cached_metadata.exists():
+            return True
+
+        # The previous artifacts might have been cleared out from under us. Plugin
+        # roots get their own bundles, so we check their outputs as well.
+        managed_dirs = [self.view_root.get_managed_metadata_dir(create_dir=False)]
+        for view_root in self.get_all_root_views():
+            managed_dirs.append(view_root.get_managed_static_dir(create_dir=False))
+            managed_dirs.append(view_root.get_managed_ssr_dir(create_dir=False))
+
+        for managed_dir in managed_dirs:
+            if not managed_dir.exists():
+                return True
+
+        return cached_metadata.read_text() != view_fingerprint
+
+    def get_view_fingerprint(self) -> str:
+        """
+        Fingerprint the inputs of the javascript build. We use the modification time and size
+        of every file in the view roots as a cheap proxy for their contents, alongside the
+        build parameters that are baked into the bundles. Build outputs are excluded since
+        they're rewritten on every build.
+
+        """
+        ignore_directories = {"_ssr", "_static", "_metadata", "node_modules"}
+
+        file_signatures: dict[str, tuple[int, int]] = {}
+        for view_root in self.get_all_root_views():
+            for dir_path, dirs, filenames in view_root.walk():
+                # Prune in-place so we don't descend into ignored directories
+                dirs[:] = [
+                    directory
+                    for directory in dirs
+                    if directory not in ignore_directories
+                ]
+                for filename in filenames:
+                    # Editors leave behind dangling lock links and delete their swap
+                    # files at any time, so files can vanish between walk() and stat()
+                    try:
+                        file_stat = (dir_path / filename).stat()
+                    except FileNotFoundError:
+                        continue
+                    file_signatures[str(dir_path / filename)] = (
+                        file_stat.st_mtime_ns,
+                        file_stat.st_size,
+                    )
+
+        return json_dumps(
+            {
+                "live_reload_port": self.live_reload_port,
+                "builders": [
+                    builder.__class__.__name__ for builder in self.app.builders
+                ],
+                "controllers": {
+                    controller_definition.controller.__class__.__name__: str(
+                        controller_definition.controller.view_path
+                    )
+                    for controller_definition in self.app.controllers
+                },
+                "files": file_signatures,
+            },
+            sort_keys=True,
+        )
+
     def get_static_files(self):
         ignore_directories = ["_ssr", "_static", "_server", "_metadata", "node_modules"]
 
@@ -654,12 +765,20 @@ class ClientBuilder:
         # to a page and another pointing to a layout in the same directory).
         # Both of these causes would cause conflicting _server files to be generated
         # which we need to avoid
+        #
+        # Validation 2: Ensure that the paths actually exist
+        #
+        # Both are collected in a single pass over the controllers. Duplicates are
+        # reported first since they're the more fundamental definition error.
         view_counts = defaultdict(list)
+        missing_view_path: ManagedViewPath | None = None
         for controller_definition in self.app.controllers:
             controller = controller_definition.controller
-            view_counts[
-                self.view_root.get_controller_view_path(controller).parent
-            ].append(controller)
+            view_path = self.view_root.get_controller_view_path(controller)
+            view_counts[view_path.parent].append(controller)
+            if missing_view_path is None and not view_path.exists():
+                missing_view_path = view_path
+
         duplicate_views = [
             (view, controllers)
             for view, controllers in view_counts.items()
@@ -676,14 +795,21 @@ class ClientBuilder:
                 ),
             )
 
-        # Validation 2: Ensure that the paths actually exist
-        for controller_definition in self.app.controllers:
-            controller = controller_definition.controller
-            view_path = self.view_root.get_controller_view_path(controller)
-            if not view_path.exists():
-                raise ValueError(
-                    f"View path {view_path} does not exist, ensure it is created before running the server"
-                )
+        if missing_view_path is not None:
+            raise ValueError(
+                f"View path {missing_view_path} does not exist, ensure it is created before running the server"
+            )
+
+    def _map_controllers(self, fn: Callable[[ControllerDefinition], None]):
+        """
+        Run a per-controller generation stage across a thread pool. Each controller
+        writes into its own managed code directory, so the workers don't contend
+        on any output files.
+
+        """
+        with ThreadPoolExecutor(max_workers=cpu_count()) as executor:
+            # Consume the results so exceptions in the workers are raised here
+            list(executor.map(fn, self.app.controllers))
 
     def get_all_root_views(self) -> list[ManagedViewPath]:
         """
@@ -715,8 +841,7 @@ class ClientBuilder:
 
         :returns ReturnModel
         """
-        render_metadata = get_function_metadata(controller.render)
-        render_model = render_metadata.get_render_model()
+        render_model = self.get_controller_state(controller).render_model
 
         if not render_model:
             raise ValueError(
@@ -725,17 +850,105 @@ class ClientBuilder:
 
         return camelize(render_model.__name__)
 
+    def get_render_model_spec(self, render_model: Type[RenderBase]) -> dict[Any, Any]:
+        """
+        JSON schema for the given render model, cached for the lifetime of the model class.
+
+        """
+        with RENDER_MODEL_CACHE_LOCK:
+            if render_model in RENDER_MODEL_SPECS:
+                return RENDER_MODEL_SPECS[render_model]
+
+        spec = self.openapi_schema_converter.get_model_json_schema(render_model)
+
+        with RENDER_MODEL_CACHE_LOCK:
+            return RENDER_MODEL_SPECS.setdefault(render_model, spec)
+
+    def get_render_model_schemas(
+        self, render_model: Type[RenderBase]
+    ) -> dict[str, str]:
+        """
+        Typescript definitions for the render model and all of its sub-models, cached
+        for the lifetime of the model class.
+
+        """
+        with RENDER_MODEL_CACHE_LOCK:
+            if render_model in RENDER_MODEL_SCHEMAS:
+                return RENDER_MODEL_SCHEMAS[render_model]
+
+        schemas = self.openapi_schema_converter.convert_schema_to_typescript(
+            OpenAPISchema(**self.get_render_model_spec(render_model)),
+            # Render models are sent server -> client, so we know they'll provide all their
+            # values in the initial payload
+            all_fields_required=True,
+        )
+
+        with RENDER_MODEL_CACHE_LOCK:
+            return RENDER_MODEL_SCHEMAS.setdefault(render_model, schemas)
+
+    def get_controller_state(self, controller: ControllerBase) -> ControllerBuildState:
+        """
+        Lazily resolve the values shared across generators for this controller. Safe
+        to call from the generator threads, since duplicate resolutions are equivalent.
+
+        """
+        if controller not in self._controller_states:
+            self._controller_states[controller] = ControllerBuildState(
+                render_model=get_function_metadata(
+                    controller.render
+                ).get_render_model(),
+                client_functions=[
+                    metadata for _, _, metadata in controller._get_client_functions()
+                ],
+            )
+        return self._controller_states[controller]
+
     def openapi_from_controller(self, controller_definition: ControllerDefinition):
         """
         Small hack to get the full path to the root of the server. By default the controller just
         has the path relative to the controller API.
 
+        OpenAPI generation is expensive and multiple build stages request the same spec, so
+        results are cached per controller for the lifetime of the current build.
+
         """
+        controller = controller_definition.controller
+        with self._openapi_cache_lock:
+            if controller in self._openapi_cache:
+                return self._openapi_cache[controller]
+
         root_router = APIRouter()
         root_router.include_router(
             controller_definition.router, prefix=controller_definition.url_prefix
         )
-        return self.app.generate_openapi(routes=root_router.routes)
+        openapi = self.app.generate_openapi(routes=root_router.routes)
+
+        with self._openapi_cache_lock:
+            return self._openapi_cache.setdefault(controller, openapi)
+
+    def openapi_definition_from_controller(
+        self, controller_definition: ControllerDefinition
+    ) -> OpenAPIDefinition:
+        """
+        Parsed counterpart to `openapi_from_controller`. Validating the raw spec copies the
+        whole document into new models, so we only do it once per controller per build and
+        share the read-only result between the model and action generators.
+
+        """
+        controller = controller_definition.controller
+        with self._openapi_cache_lock:
+            if controller in self._openapi_definition_cache:
+                return self._openapi_definition_cache[controller]
+
+        openapi = self.openapi_from_controller(controller_definition)
+        try:
+            definition = OpenAPIDefinition(**openapi)
+        except ValidationError as e:
+            LOGGER.error(f"Error parsing {controller} action spec: {openapi} {e}")
+            raise e
+
+        with self._openapi_cache_lock:
+            return self._openapi_definition_cache.setdefault(controller, definition)
 
     @property
     def openapi_action_specs(self):
@@ -744,16 +957,12 @@ class ClientBuilder:
         are defined differently. We internally cache this for all stages that require it.
 
         """
-        if not hasattr(self, "_openapi_action_specs"):
-            self._openapi_specs: dict[ControllerBase, dict[Any, Any]] = {}
-
-            for controller_definition in self.app.controllers:
-                controller = controller_definition.controller
-                self._openapi_specs[controller] = self.openapi_from_controller(
-                    controller_definition
-                )
-
-        return self._openapi_specs
+        return {
+            controller_definition.controller: self.openapi_from_controller(
+                controller_definition
+            )
+            for controller_definition in self.app.controllers
+        }
 
     @property
     def openapi_render_specs(self):
@@ -766,20 +975,18 @@ class ClientBuilder:
 
         """
         if not hasattr(self, "_openapi_render_specs"):
-            self._openapi_render_specs: dict[ControllerBase, RenderSpec] = {}
+            # Only publish the specs once they're complete, since generators running
+            # in parallel threads might access this property concurrently
+            render_specs: dict[ControllerBase, RenderSpec] = {}
 
             for controller_definition in self.app.controllers:
                 controller = controller_definition.controller
-
-                render_metadata = get_function_metadata(controller.render)
-                render_model = render_metadata.get_render_model()
+                render_model = self.get_controller_state(controller).render_model
 
                 spec = (
-                    self.openapi_schema_converter.get_model_json_schema(render_model)
-                    if render_model
-                    else None
+                    self.get_render_model_spec(render_model) if render_model else None
                 )
-                self._openapi_render_specs[controller] = RenderSpec(
+                render_specs[controller] = RenderSpec(
                     url=None
                     if isinstance(controller, LayoutControllerBase)
                     else controller.url,
@@ -787,4 +994,6 @@ class ClientBuilder:
                     spec=spec,
                 )
 
+            self._openapi_render_specs = render_specs
+
         return self._openapi_render_specs
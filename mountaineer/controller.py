@@ -391,13 +391,13 @@ class ControllerBase(ABC, Generic[RenderInput]):
         else:
             found_dependencies = False
 
-        # Find the md5-converted cache path
-        md5_script_pattern = re_compile(script_name + "-" + "[a-f0-9]{32}" + ".js")
+        # Find the content-hashed cache path
+        hashed_script_pattern = re_compile(script_name + "-" + "[a-f0-9]{32}" + ".js")
         if (view_base / "_static").exists():
             self.bundled_scripts = [
                 path.name
                 for path in (view_base / "_static").iterdir()
-                if md5_script_pattern.match(path.name) and ".js.map" not in path.name
+                if hashed_script_pattern.match(path.name) and ".js.map" not in path.name
             ]
             if not self.bundled_scripts:
                 found_dependencies = False
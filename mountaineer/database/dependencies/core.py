@@ -1,6 +1,9 @@
+import asyncio
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
+    AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
@@ -14,6 +17,13 @@ from mountaineer.logging import LOGGER
 # We share the connection pool across the entire process
 GLOBAL_ENGINE: AsyncLoopObjectCache[AsyncEngine] = AsyncLoopObjectCache()
 
+# Session factories are a pure function of their engine, so we only build one for the
+# global engine instead of one per request. Cached per loop alongside the engine, so
+# both are released together when the loop is cleaned up.
+GLOBAL_SESSION_MAKER: AsyncLoopObjectCache[
+    async_sessionmaker[AsyncSession]
+] = AsyncLoopObjectCache()
+
 
 async def get_db(
     config: DatabaseConfig = Depends(
@@ -88,7 +98,13 @@ async def get_db_session(
     ```
 
     """
-    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    session_maker = GLOBAL_SESSION_MAKER.get_obj()
+    if session_maker is None or session_maker.kw.get("bind") is not engine:
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        # Engines provided by other means (like test overrides) aren't cached
+        if engine is GLOBAL_ENGINE.get_obj():
+            GLOBAL_SESSION_MAKER.set_obj(session_maker)
+
     async with session_maker() as session:
         try:
             yield session
@@ -104,7 +120,14 @@ async def unregister_global_engine():
     """
     Unregisters the global engines used by all async loops.
     """
+    engines = []
     for key in list(GLOBAL_ENGINE.loop_caches.keys()):
-        engine = GLOBAL_ENGINE.loop_caches[key]
-        await engine.dispose()
-        del GLOBAL_ENGINE.loop_caches[key]
+        # The owning loop might have been garbage collected in the meantime
+        engine = GLOBAL_ENGINE.loop_caches.pop(key, None)
+        if engine is not None:
+            engines.append(engine)
+
+    GLOBAL_SESSION_MAKER.loop_caches.clear()
+
+    # Each dispose closes its own pool of connections, so they can run concurrently
+    await asyncio.gather(*(engine.dispose() for engine in engines))
@@ -3,4 +3,6 @@ from .base import (
     DependenciesBase as DependenciesBase,
     get_function_dependencies as get_function_dependencies,
     isolate_dependency_only_function as isolate_dependency_only_function,
+    resolve_function_dependencies as resolve_function_dependencies,
+    warm_dependencies as warm_dependencies,
 )
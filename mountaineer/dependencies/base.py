@@ -1,11 +1,31 @@
+import asyncio
 import warnings
-from contextlib import AsyncExitStack, asynccontextmanager
-from dataclasses import dataclass
+from collections.abc import Hashable
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    asynccontextmanager,
+    nullcontext,
+)
+from copy import copy
+from dataclasses import dataclass, field
+from functools import lru_cache
 from inspect import signature
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Iterable
 
 from fastapi import Request, params as fastapi_params
-from fastapi.dependencies.utils import get_dependant, solve_dependencies
+from fastapi.dependencies.models import Dependant
+from fastapi.dependencies.utils import (
+    get_dependant,
+    is_async_gen_callable,
+    is_coroutine_callable,
+    is_gen_callable,
+    solve_dependencies,
+    solve_generator,
+)
+from starlette.background import BackgroundTasks
+from starlette.concurrency import run_in_threadpool
 
 
 class DependenciesBaseMeta(type):
@@ -24,9 +44,14 @@ class DependenciesBaseMeta(type):
 
     """
 
+    # The deprecation only needs to be surfaced once per process, not once for
+    # every subclass defined at import time
+    deprecation_warned: bool = False
+
     def __new__(cls, name, bases, namespace, **kwargs):
         # Flag any child instances as deprecated but not the base model
-        if name != "DependenciesBase":
+        if name != "DependenciesBase" and not cls.deprecation_warned:
+            cls.deprecation_warned = True
             warnings.warn(
                 (
                     "DependenciesBase is deprecated and will be removed in a future version.\n"
@@ -36,11 +61,18 @@ class DependenciesBaseMeta(type):
                 stacklevel=2,
             )
 
-        for attr_name, attr_value in namespace.items():
-            if isinstance(attr_value, staticmethod):
-                raise TypeError(
-                    f"Static methods are not allowed in dependency wrapper '{name}'. Found static method: '{attr_name}'."
-                )
+        static_attr_name = next(
+            (
+                attr_name
+                for attr_name, attr_value in namespace.items()
+                if isinstance(attr_value, staticmethod)
+            ),
+            None,
+        )
+        if static_attr_name is not None:
+            raise TypeError(
+                f"Static methods are not allowed in dependency wrapper '{name}'. Found static method: '{static_attr_name}'."
+            )
         return super().__new__(cls, name, bases, namespace, **kwargs)
 
 
@@ -48,11 +80,465 @@ class DependenciesBase(metaclass=DependenciesBaseMeta):
     pass
 
 
-@dataclass
-class DependencyOverrideProvider:
-    # Internally FastAPI uses a property accessor to access the dependency_overrides, so we
-    # reproduce this with a simple dataclass
-    dependency_overrides: dict[Callable, Callable]
+@lru_cache(maxsize=1024)
+def get_cached_dependant(call: Callable, path: str) -> Dependant:
+    """
+    Building a dependant requires inspecting the signature of the callable and all
+    of its sub-dependencies. These rarely change once defined, so we reuse the result
+    across calls to `get_function_dependencies`.
+
+    """
+    return get_dependant(call=call, path=path)
+
+
+@dataclass(slots=True)
+class PlannedDependency:
+    key: Hashable
+    call: Callable
+    is_coroutine: bool
+    is_generator: bool
+    # Argument-free sync callables wrapped in functools.cache / lru_cache only do real
+    # work on their first call, so we call them inline instead of on the threadpool
+    is_memoized: bool = False
+    # (parameter name, key of the planned dependency that provides it)
+    arguments: list[tuple[str, Hashable]] = field(default_factory=list)
+    request_param_name: str | None = None
+
+
+@dataclass(slots=True)
+class DependencyPlan:
+    """
+    Precomputed resolution order for the sub-dependencies of a callable. By default they're
+    resolved one at a time in the same order as FastAPI. Callers can opt into resolving
+    each layer concurrently, since a layer only depends on values from earlier layers.
+
+    """
+
+    dependant: Dependant
+
+    # None if the tree uses features that only FastAPI's `solve_dependencies` supports,
+    # like sub-dependencies that read request parameters. Dependencies that share a
+    # generator (like a database session) are split into separate layers, since the
+    # resources they yield usually aren't safe to use concurrently.
+    layers: list[list[PlannedDependency]] | None
+
+    # (parameter name, key) for the sub-dependencies that are passed to the callable
+    arguments: list[tuple[str, Hashable]]
+
+    # Copy of the dependant without its sub-dependencies, to resolve the parameters the
+    # callable reads directly from the request. None if there aren't any.
+    request_params: Dependant | None
+
+    # Whether any dependency is a generator that has to be torn down once the caller
+    # is done with the values
+    needs_stack: bool
+
+    # The callable doesn't request any values, so there's nothing to resolve
+    is_trivial: bool
+
+    # Planned dependencies in the order FastAPI would resolve them. Empty whenever `layers`
+    # is None.
+    resolution_order: list[PlannedDependency]
+
+    # Generating a resolver only pays off for plans that are resolved repeatedly. One-off
+    # plans (like those for unhashable callables) are cheaper to solve with FastAPI, so
+    # this is only set once we know the plan will be reused.
+    use_resolver: bool = False
+
+    # Generated function that resolves the dependencies one at a time, with the signature
+    # (request, async_exit_stack) -> values. Compiled the first time it's used.
+    resolver: Callable[..., Awaitable[dict[str, Any]]] | None = None
+
+    # Equivalent of `resolver` that resolves each layer concurrently. Compiled the first
+    # time a caller opts in.
+    concurrent_resolver: Callable[..., Awaitable[dict[str, Any]]] | None = None
+
+    # Errors from resolving against our synthetic request. These only depend on the
+    # dependant and the request, so they'll be the same for every synthetic call.
+    synthetic_errors: list[Any] | None = None
+
+
+def reads_request_params(dependant: Dependant):
+    """
+    Whether the dependant requests values that FastAPI has to parse out of the request,
+    beyond the request object itself.
+
+    """
+    return bool(
+        dependant.path_params
+        or dependant.query_params
+        or dependant.header_params
+        or dependant.cookie_params
+        or dependant.body_params
+        or dependant.websocket_param_name
+        or dependant.http_connection_param_name
+        or dependant.response_param_name
+        or dependant.background_tasks_param_name
+        or dependant.security_scopes_param_name
+    )
+
+
+def is_plannable_dependency(dependant: Dependant):
+    """
+    Whether we can resolve this sub-dependency by just calling it with the values of
+    its own sub-dependencies.
+
+    """
+    if dependant.call is None or not dependant.use_cache:
+        return False
+    return not reads_request_params(dependant)
+
+
+def has_generator_dependencies(dependant: Dependant) -> bool:
+    return any(
+        sub_dependant.call is not None
+        and (
+            is_gen_callable(sub_dependant.call)
+            or is_async_gen_callable(sub_dependant.call)
+        )
+        or has_generator_dependencies(sub_dependant)
+        for sub_dependant in dependant.dependencies
+    )
+
+
+def apply_dependency_overrides(
+    dependant: Dependant, dependency_overrides: dict[Callable, Callable]
+) -> Dependant:
+    """
+    Substitute the overrides into a copy of the dependency tree, the same way FastAPI
+    swaps them in while solving. Overrides apply to their own sub-dependencies as well.
+    The resulting tree can be planned like any other, so overridden calls don't have to
+    rebuild every sub-dependant on each resolution.
+
+    """
+    overridden_dependant = copy(dependant)
+    overridden_dependant.dependencies = []
+    for sub_dependant in dependant.dependencies:
+        call = dependency_overrides.get(sub_dependant.call, sub_dependant.call)  # type: ignore
+        if call is not sub_dependant.call:
+            sub_dependant = get_dependant(
+                path=sub_dependant.path,  # type: ignore
+                call=call,
+                name=sub_dependant.name,
+                security_scopes=sub_dependant.security_scopes,
+            )
+        overridden_dependant.dependencies.append(
+            apply_dependency_overrides(sub_dependant, dependency_overrides)
+        )
+    return overridden_dependant
+
+
+def compile_dependency_plan(dependant: Dependant) -> DependencyPlan:
+    """
+    Group the sub-dependencies by the length of their longest path to a leaf. Dependencies
+    are keyed the same way as FastAPI's dependency cache, so a dependency that's shared by
+    multiple parts of the tree is still only resolved once.
+
+    """
+    # Dependencies are added once all of their own dependencies are planned, which
+    # matches the order that FastAPI resolves them in
+    planned: dict[Hashable, PlannedDependency] = {}
+    depths: dict[Hashable, int] = {}
+    generator_ancestors: dict[Hashable, frozenset[Hashable]] = {}
+
+    def visit(sub_dependant: Dependant) -> Hashable | None:
+        if not is_plannable_dependency(sub_dependant):
+            return None
+        key = sub_dependant.cache_key
+        if key in depths:
+            return key
+
+        is_coroutine = is_coroutine_callable(sub_dependant.call)  # type: ignore
+        is_generator = is_gen_callable(
+            sub_dependant.call  # type: ignore
+        ) or is_async_gen_callable(sub_dependant.call)  # type: ignore
+        planned_dependency = PlannedDependency(
+            key=key,
+            call=sub_dependant.call,  # type: ignore
+            is_coroutine=is_coroutine,
+            is_generator=is_generator,
+            # With arguments, every new value is a cache miss that could block
+            is_memoized=(
+                hasattr(sub_dependant.call, "cache_info")
+                and not is_coroutine
+                and not is_generator
+                and not sub_dependant.dependencies
+                and not sub_dependant.request_param_name
+            ),
+            request_param_name=sub_dependant.request_param_name,
+        )
+        depth = 0
+        ancestors: frozenset[Hashable] = frozenset([key] if is_generator else [])
+        for child in sub_dependant.dependencies:
+            child_key = visit(child)
+            if child_key is None:
+                return None
+            if child.name is not None:
+                planned_dependency.arguments.append((child.name, child_key))
+            depth = max(depth, depths[child_key] + 1)
+            ancestors |= generator_ancestors[child_key]
+
+        planned[key] = planned_dependency
+        depths[key] = depth
+        generator_ancestors[key] = ancestors
+        return key
+
+    arguments: list[tuple[str, Hashable]] = []
+    layers: list[list[PlannedDependency]] | None = []
+    for sub_dependant in dependant.dependencies:
+        key = visit(sub_dependant)
+        if key is None:
+            layers = None
+            break
+        if sub_dependant.name is not None:
+            arguments.append((sub_dependant.name, key))
+
+    if layers is not None:
+        depth_layers: list[list[PlannedDependency]] = [
+            [] for _ in range(max(depths.values(), default=-1) + 1)
+        ]
+        for key, planned_dependency in planned.items():
+            depth_layers[depths[key]].append(planned_dependency)
+
+        for depth_layer in depth_layers:
+            layer: list[PlannedDependency] = []
+            layer_ancestors: frozenset[Hashable] = frozenset()
+            for planned_dependency in depth_layer:
+                ancestors = generator_ancestors[planned_dependency.key]
+                if not layer_ancestors.isdisjoint(ancestors):
+                    layers.append(layer)
+                    layer, layer_ancestors = [], frozenset()
+                layer.append(planned_dependency)
+                layer_ancestors |= ancestors
+            layers.append(layer)
+
+    request_params: Dependant | None = None
+    if reads_request_params(dependant) or dependant.request_param_name:
+        request_params = copy(dependant)
+        request_params.dependencies = []
+
+    return DependencyPlan(
+        dependant=dependant,
+        layers=layers,
+        arguments=arguments,
+        request_params=request_params,
+        needs_stack=has_generator_dependencies(dependant),
+        is_trivial=not dependant.dependencies and request_params is None,
+        resolution_order=list(planned.values()) if layers is not None else [],
+    )
+
+
+def get_plan_resolver(
+    plan: DependencyPlan, *, concurrent: bool
+) -> Callable[..., Awaitable[dict[str, Any]]] | None:
+    if plan.layers is None:
+        return None
+    if not concurrent:
+        if plan.resolver is None:
+            plan.resolver = compile_dependency_resolver(
+                [[planned_dependency] for planned_dependency in plan.resolution_order],
+                plan.arguments,
+            )
+        return plan.resolver
+    if plan.concurrent_resolver is None:
+        plan.concurrent_resolver = compile_dependency_resolver(
+            plan.layers, plan.arguments
+        )
+    return plan.concurrent_resolver
+
+
+async def gather_dependencies(*awaitables: Awaitable[Any]) -> list[Any]:
+    """
+    Like `asyncio.gather`, but if any dependency fails the others are cancelled and awaited
+    before the error propagates. Otherwise a sibling generator could still be entering the
+    exit stack after the caller has already unwound it, so it would never be cleaned up.
+
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def compile_dependency_resolver(
+    layers: list[list[PlannedDependency]],
+    arguments: list[tuple[str, Hashable]],
+) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """
+    Generate a straight-line coroutine that resolves the given layers, so each call
+    doesn't have to walk the plan again. Layers with more than one dependency are
+    resolved concurrently. For example:
+
+        async def resolve_dependencies(request, async_exit_stack):
+            value_0 = await call_0()
+            value_1, value_2 = await gather_dependencies(
+                call_1(config=value_0),
+                run_in_threadpool(call_2, config=value_0, request=request),
+            )
+            return {"service": value_1, "session": value_2}
+
+    """
+    namespace: dict[str, Any] = {
+        "gather_dependencies": gather_dependencies,
+        "run_in_threadpool": run_in_threadpool,
+        "solve_generator": solve_generator,
+    }
+    variables: dict[Hashable, str] = {}
+
+    def build_call(planned_dependency: PlannedDependency, call_name: str):
+        kwargs = [(name, variables[key]) for name, key in planned_dependency.arguments]
+        if planned_dependency.request_param_name:
+            kwargs.append((planned_dependency.request_param_name, "request"))
+
+        if planned_dependency.is_generator:
+            sub_values = ", ".join(f"{name!r}: {value}" for name, value in kwargs)
+            return (
+                f"solve_generator(call={call_name}, stack=async_exit_stack, "
+                f"sub_values={{{sub_values}}})"
+            )
+
+        call_kwargs = [f"{name}={value}" for name, value in kwargs]
+        if planned_dependency.is_coroutine or planned_dependency.is_memoized:
+            return f"{call_name}({', '.join(call_kwargs)})"
+        return f"run_in_threadpool({', '.join([call_name, *call_kwargs])})"
+
+    lines = ["async def resolve_dependencies(request, async_exit_stack):"]
+    for layer in layers:
+        layer_calls: list[str] = []
+        layer_variables: list[str] = []
+        for planned_dependency in layer:
+            index = len(variables)
+            call_name = f"call_{index}"
+            namespace[call_name] = planned_dependency.call
+            variables[planned_dependency.key] = f"value_{index}"
+            call = build_call(planned_dependency, call_name)
+            if planned_dependency.is_memoized:
+                lines.append(f"    value_{index} = {call}")
+            else:
+                layer_calls.append(call)
+                layer_variables.append(f"value_{index}")
+
+        if not layer_calls:
+            continue
+        # Scheduling a single dependency as a task just adds overhead
+        if len(layer_calls) == 1:
+            lines.append(f"    {layer_variables[0]} = await {layer_calls[0]}")
+        else:
+            lines.append(
+                f"    {', '.join(layer_variables)} = await gather_dependencies({', '.join(layer_calls)})"
+            )
+
+    return_values = ", ".join(f"{name!r}: {variables[key]}" for name, key in arguments)
+    lines.append(f"    return {{{return_values}}}")
+
+    code = compile("\n".join(lines), filename="<dependency resolver>", mode="exec")
+    exec(code, namespace)
+
+    resolver: Callable[..., Awaitable[dict[str, Any]]] = namespace[
+        "resolve_dependencies"
+    ]
+    return resolver
+
+
+@lru_cache(maxsize=1024)
+def get_dependency_plan(call: Callable, path: str) -> DependencyPlan:
+    plan = compile_dependency_plan(get_cached_dependant(call, path))
+    # Hashable callables are almost always module-level functions or methods that
+    # will be resolved again
+    plan.use_resolver = True
+    return plan
+
+
+@lru_cache(maxsize=256)
+def get_override_plan(
+    call: Callable,
+    path: str,
+    dependency_overrides: tuple[tuple[Callable, Callable], ...],
+) -> DependencyPlan:
+    """
+    Overrides are keyed by their contents rather than the dictionary's identity, so
+    callers can reuse (or mutate) the same dictionary across calls. Overrides built from
+    fresh closures on every call never hit this cache, so these plans only switch to a
+    generated resolver once they're resolved a second time.
+
+    """
+    return compile_dependency_plan(
+        apply_dependency_overrides(
+            get_cached_dependant(call, path), dict(dependency_overrides)
+        )
+    )
+
+
+async def solve_dependency_plan(
+    plan: DependencyPlan,
+    *,
+    request: Request,
+    async_exit_stack: AsyncExitStack | None,
+    concurrent: bool = False,
+) -> tuple[dict[str, Any], list[Any], BackgroundTasks | None]:
+    """
+    Resolve the dependencies of a compiled plan. Mirrors the return values of FastAPI's
+    `solve_dependencies` that we make use of: (values, errors, background_tasks).
+
+    :param async_exit_stack: Required if the plan `needs_stack`.
+    :param concurrent: Resolve the dependencies within each layer concurrently.
+
+    """
+    resolver = get_plan_resolver(plan, concurrent=concurrent)
+    if resolver is None:
+        raise ValueError("Dependency plan can't be resolved without FastAPI")
+    if plan.needs_stack and async_exit_stack is None:
+        raise ValueError("Generator dependencies require an exit stack")
+
+    values = await resolver(request, async_exit_stack)
+    if plan.request_params is None:
+        return values, [], None
+
+    request_values, errors, background_tasks, _, _ = await solve_dependencies(
+        request=request,
+        dependant=plan.request_params,
+        # This dependant has no sub-dependencies, so FastAPI never enters the stack
+        async_exit_stack=async_exit_stack or AsyncExitStack(),
+    )
+    values.update(request_values)
+    return values, errors, background_tasks
+
+
+# Base ASGI scope for requests that we synthesize. Values use the types that servers
+# provide so starlette doesn't have to coerce them.
+SYNTHETIC_SCOPE = MappingProxyType(
+    {
+        "type": "http",
+        "query_string": b"",
+        "headers": (),
+    }
+)
+
+
+def get_request_defaults(
+    url: str | None, request: Request | None
+) -> tuple[str, Request, bool]:
+    """
+    Fill in the url and request when the caller doesn't provide them. Returns
+    (url, request, is_synthetic).
+
+    Requests are mutable (dependencies can write to `request.state`), so every call
+    gets its own synthetic request. Only the base scope is shared.
+
+    """
+    if url is None:
+        url = "/synthetic"
+    if request is not None:
+        return url, request, False
+    return (
+        url,
+        Request(scope={**SYNTHETIC_SCOPE, "path": url, "path_params": {}}),
+        True,
+    )
 
 
 @asynccontextmanager
@@ -62,6 +548,7 @@ async def get_function_dependencies(
     url: str | None = None,
     request: Request | None = None,
     dependency_overrides: dict[Callable, Callable] | None = None,
+    concurrent: bool = False,
 ):
     """
     Get the dependencies of a function. This will return the values that should
@@ -71,49 +558,161 @@ async def get_function_dependencies(
     :param dependency_overrides: Specify functions that should be swapped-in when resolving
     the dependency chains. This is useful during testing or when you need to override one value
     in a dependency pipeline (like a user session) with a deterministic value.
+    :param concurrent: Resolve independent dependencies concurrently instead of one at a time.
+    Only enable this if your dependencies are safe to run in parallel. Dependencies that share
+    a generator, like a database session, are still resolved one at a time.
 
     """
-    # Synthesize defaults
-    if not url:
-        url = "/synthetic"
-    if not request:
-        request = Request(
-            scope={
-                "type": "http",
-                "path": url,
-                "path_params": {},
-                "query_string": "",
-                "headers": [],
-            }
+    url, request, is_synthetic = get_request_defaults(url, request)
+
+    plan = get_function_plan(callable, url, dependency_overrides)
+    if plan.is_trivial:
+        yield {}
+        return
+
+    # Most dependency trees don't have any generators to clean up, in which case we can
+    # skip setting up the exit stack
+    exit_stack_context: AbstractAsyncContextManager[Any] = nullcontext()
+    if plan.needs_stack:
+        exit_stack_context = AsyncExitStack()
+
+    async with exit_stack_context as async_exit_stack:
+        yield await solve_function_dependencies(
+            plan,
+            request=request,
+            async_exit_stack=async_exit_stack,
+            memoize_errors=is_synthetic and not dependency_overrides,
+            concurrent=concurrent,
         )
 
-    # Synthetic request object as if we're coming from the original first page
-    dependant = get_dependant(
-        call=callable,
-        path=url,
+
+async def resolve_function_dependencies(
+    *,
+    callable: Callable,
+    url: str | None = None,
+    request: Request | None = None,
+    concurrent: bool = False,
+) -> dict[str, Any]:
+    """
+    Plain async alternative to `get_function_dependencies`, for callables whose dependencies
+    don't need to be torn down once the values are used. This avoids the overhead of
+    the context manager.
+
+    :param concurrent: See `get_function_dependencies`.
+    :raises ValueError: If any of the dependencies are generators. These need to be resolved
+        with `get_function_dependencies` so they can be cleaned up.
+
+    """
+    url, request, is_synthetic = get_request_defaults(url, request)
+
+    plan = get_function_plan(callable, url)
+    if plan.is_trivial:
+        return {}
+    if plan.needs_stack:
+        raise ValueError(
+            f"Dependencies of {callable} require cleanup, use `get_function_dependencies` instead."
+        )
+
+    return await solve_function_dependencies(
+        plan,
+        request=request,
+        async_exit_stack=None,
+        memoize_errors=is_synthetic,
+        concurrent=concurrent,
+    )
+
+
+def get_function_plan(
+    callable: Callable,
+    url: str,
+    dependency_overrides: dict[Callable, Callable] | None = None,
+) -> DependencyPlan:
+    is_hashable = isinstance(callable, Hashable)
+    if not dependency_overrides:
+        return (
+            get_dependency_plan(callable, url)
+            if is_hashable
+            else compile_dependency_plan(get_dependant(call=callable, path=url))
+        )
+
+    override_items = tuple(dependency_overrides.items())
+    if is_hashable and all(
+        isinstance(override, Hashable) for _, override in override_items
+    ):
+        return get_override_plan(callable, url, override_items)
+    return compile_dependency_plan(
+        apply_dependency_overrides(
+            get_dependant(call=callable, path=url), dependency_overrides
+        )
     )
 
-    async with AsyncExitStack() as async_exit_stack:
-        values, errors, background_tasks, sub_response, _ = await solve_dependencies(
+
+def warm_dependencies(calls: Iterable[Callable], url: str = "/synthetic") -> None:
+    """
+    Compile the dependency plans of known callables ahead of time, so the first call
+    to `get_function_dependencies` doesn't pay for inspecting the dependency tree.
+
+    :param url: Should match the url that the callables will later be resolved with, since
+        plans are cached per url.
+
+    """
+    for call in calls:
+        # Unhashable callables are planned on every call, so there's nothing to warm
+        if isinstance(call, Hashable):
+            get_dependency_plan(call, url)
+
+
+BACKGROUND_TASKS_ERROR = "Background tasks are not supported when calling a static function, due to undesirable side-effects."
+
+
+async def solve_function_dependencies(
+    plan: DependencyPlan,
+    *,
+    request: Request,
+    async_exit_stack: AsyncExitStack | None,
+    memoize_errors: bool = False,
+    concurrent: bool = False,
+) -> dict[str, Any]:
+    """
+    Shared resolution logic for our public entrypoints. Uses the precomputed plan when
+    we can, otherwise falls back to FastAPI's own resolution.
+
+    :param async_exit_stack: Required if the plan `needs_stack`.
+    :param memoize_errors: Whether resolution errors are deterministic for this plan, so we
+        can fail immediately on subsequent calls instead of resolving the tree again.
+    :param concurrent: Resolve the dependencies within each layer concurrently.
+
+    """
+    if memoize_errors and plan.synthetic_errors:
+        raise RuntimeError(
+            f"Errors encountered while resolving dependencies: {plan.synthetic_errors}"
+        )
+
+    if plan.layers is not None and plan.use_resolver:
+        values, errors, background_tasks = await solve_dependency_plan(
+            plan,
             request=request,
-            dependant=dependant,
             async_exit_stack=async_exit_stack,
-            dependency_overrides_provider=(
-                DependencyOverrideProvider(dependency_overrides=dependency_overrides)
-                if dependency_overrides
-                else None
-            ),
+            concurrent=concurrent,
         )
-        if background_tasks:
-            raise RuntimeError(
-                "Background tasks are not supported when calling a static function, due to undesirable side-effects."
-            )
-        if errors:
-            raise RuntimeError(
-                f"Errors encountered while resolving dependencies: {errors}"
-            )
+    else:
+        values, errors, background_tasks, _, _ = await solve_dependencies(
+            request=request,
+            dependant=plan.dependant,
+            # Without generators to clean up FastAPI never enters the stack
+            async_exit_stack=async_exit_stack or AsyncExitStack(),
+        )
+        # Only cached plans are ever resolved again
+        plan.use_resolver = True
+
+    if background_tasks:
+        raise RuntimeError(BACKGROUND_TASKS_ERROR)
+    if errors:
+        if memoize_errors:
+            plan.synthetic_errors = errors
+        raise RuntimeError(f"Errors encountered while resolving dependencies: {errors}")
 
-        yield values
+    return values
 
 
 def isolate_dependency_only_function(original_fn: Callable):
@@ -1,6 +1,7 @@
 import asyncio
 import socket
 from functools import lru_cache, wraps
+from pathlib import Path
 from typing import Any, Callable, Coroutine, TypeVar
 
 
@@ -48,6 +49,26 @@ def get_free_port() -> int:
     return int(port)
 
 
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Write the given content to disk only if it differs from what's already there. This
+    avoids the write syscalls for unchanged files, and keeps their modification times
+    stable so file watchers and build caches don't see spurious updates.
+
+    :return: Whether the file was written.
+
+    """
+    encoded = content.encode("utf-8")
+    try:
+        if path.read_bytes() == encoded:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.write_bytes(encoded)
+    return True
+
+
 def lru_cache_async(
     maxsize: int | None = 100,
 ):
@@ -1,3 +1,4 @@
+import asyncio
 import multiprocessing
 from dataclasses import dataclass
 from pathlib import Path
@@ -171,6 +172,24 @@ class JavascriptBundler(ClientBuilderBase):
             # We only know how to parse tsx and jsx files
             return None
 
+        # Preparing the bundle is blocking filesystem work (layout sniffing, writing the
+        # synthetic entrypoints, linking node_modules). Offload it to a worker thread so
+        # the preparation for multiple controllers can overlap instead of serially
+        # blocking the event loop. The actual compilation happens in finish_build.
+        payload = await asyncio.to_thread(
+            self.prepare_js_bundle,
+            file_path=file_path,
+            controller=controller,
+            metadata=metadata,
+        )
+        self.pending_files.append(payload)
+
+    def prepare_js_bundle(
+        self,
+        file_path: ManagedViewPath,
+        controller: ControllerBase,
+        metadata: ClientBundleMetadata,
+    ) -> JSBundle:
         # Build the metadata archive for this controller now that
         # we have the file location context
         controller_base = underscore(controller.__class__.__name__)
@@ -182,10 +201,9 @@ class JavascriptBundler(ClientBuilderBase):
         (metadata_dir / f"{controller_base}.json").write_text(metadata_payload)
 
         # Now we can process the files in bulk
-        payload = self.generate_js_bundle(
+        return self.generate_js_bundle(
             file_path=file_path, controller=controller, metadata=metadata
         )
-        self.pending_files.append(payload)
 
     async def finish_build(self):
         if not self.global_state:
@@ -221,10 +221,14 @@ fn mountaineer(_py: Python, m: &PyModule) -> PyResult<()> {
             let map_name: String;
 
             if !param.is_server {
-                // Only client files need the hash
+                // Only client files need the hash. This is purely a cache-buster, so we use
+                // the non-cryptographic xxh3 instead of md5. The 128-bit digest keeps the same
+                // 32 hex character suffix that clients match on.
                 let content_hash = format!(
-                    "{:x}",
-                    md5::compute(lexers::strip_js_comments(&script_contents, true).as_bytes())
+                    "{:032x}",
+                    xxhash_rust::xxh3::xxh3_128(
+                        lexers::strip_js_comments(&script_contents, true).as_bytes()
+                    )
                 );
                 script_name = format!("{}-{}.js", param.controller_name, content_hash);
                 map_name = format!("{}.map", script_name);